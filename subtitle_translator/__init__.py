@@ -1,5 +1,6 @@
 """Subtitle Translator - A powerful tool for translating subtitle files."""
 
+import importlib
 from pathlib import Path
 
 # Version of the package
@@ -17,14 +18,35 @@ UI_DIR = PACKAGE_ROOT / "ui"
 # Icons directory
 ICONS_DIR = PACKAGE_ROOT / "icons"
 
-# Ensure directories exist
-for directory in [DATA_DIR, UI_DIR, ICONS_DIR]:
-    directory.mkdir(exist_ok=True)
+# Public names resolved on first access (PEP 562) so that importing the
+# package does not pull in the translator backends, PyQt6 or argparse.
+_LAZY_ATTRS = {
+    'Translator': ('.core.translator', 'Translator'),
+    'TranslationConfig': ('.core.translator', 'TranslationConfig'),
+    'gui_main': ('.gui.main', 'main'),
+    'cli_main': ('.cli.main', 'main'),
+}
+
+
+def ensure_directories() -> None:
+    """Create the package data directories if they do not exist yet."""
+    for directory in [DATA_DIR, UI_DIR, ICONS_DIR]:
+        directory.mkdir(exist_ok=True)
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
-# Import core functionality
-from .core.translator import Translator, TranslationConfig
-from .gui.main import main as gui_main
-from .cli.main import main as cli_main
 
 __all__ = [
     'Translator',
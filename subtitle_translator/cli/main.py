@@ -3,15 +3,24 @@
 import argparse
 import asyncio
 import logging
+import os
+import stat
 import sys
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 
-from ..core import Translator, TranslationConfig
+from .. import __version__, ensure_directories
+from ..core import Translator, TranslationConfig, ConfigurationError
 from ..utils.config import ConfigManager
 
 logger = logging.getLogger(__name__)
 
+# Subtitle file extensions picked up when scanning directories
+SUBTITLE_EXTENSIONS = frozenset({'.srt', '.ass', '.ssa', '.vtt'})
+
+# Number of files translated at the same time unless --concurrency is given
+DEFAULT_CONCURRENCY = 4
+
 
 def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     """Parse command line arguments.
@@ -31,6 +40,7 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     io_group.add_argument(
         'input',
         type=str,
+        nargs='?',
         help='Input subtitle file or directory'
     )
     io_group.add_argument(
@@ -102,6 +112,28 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         default=None,
         help='Request timeout in seconds'
     )
+    trans_group.add_argument(
+        '--concurrency',
+        type=int,
+        default=None,
+        help=f'Number of files to translate concurrently (default: {DEFAULT_CONCURRENCY})'
+    )
+    trans_group.add_argument(
+        '--request-concurrency',
+        type=int,
+        default=None,
+        help='Number of requests the backend sends at the same time (default: backend specific)'
+    )
+    trans_group.add_argument(
+        '--compress-requests',
+        action='store_true',
+        help='Gzip request bodies; the translation server must accept compressed requests'
+    )
+    trans_group.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always translate, ignoring previously cached translations'
+    )
     
     # Output options
     out_group = parser.add_argument_group('Output')
@@ -130,9 +162,33 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         help='Save current options to config file'
     )
     
+    parser.add_argument(
+        '--version',
+        action='version',
+        version=f'%(prog)s {__version__}'
+    )
+    
     return parser.parse_args(args)
 
 
+def _peek_option(args: List[str], name: str) -> Optional[str]:
+    """Return the value of a long option from raw arguments without argparse.
+    
+    Args:
+        args: Raw command line arguments
+        name: Option name, e.g. '--config'
+        
+    Returns:
+        The option value, or None if the option is absent
+    """
+    for i, arg in enumerate(args):
+        if arg == name and i + 1 < len(args):
+            return args[i + 1]
+        if arg.startswith(name + '='):
+            return arg[len(name) + 1:]
+    return None
+
+
 def setup_logging(verbosity: int = 0, quiet: bool = False) -> None:
     """Configure logging based on verbosity level.
     
@@ -155,23 +211,41 @@ def setup_logging(verbosity: int = 0, quiet: bool = False) -> None:
     )
 
 
-def list_languages(config: ConfigManager) -> None:
+def list_languages(languages: Dict[str, str]) -> None:
     """List available languages and exit.
     
     Args:
-        config: Configuration manager
+        languages: Mapping of language codes to display names
     """
-    languages = config.get_available_languages()
     if not languages:
         print("No languages configured.")
         return
     
-    max_code_len = max(len(code) for code in languages)
-    print(f"{'Code':<{max_code_len}}  Language")
-    print('-' * (max_code_len + 2 + 50))  # 50 is a reasonable max for language names
+    items = sorted(languages.items())
+    max_code_len = max(len(code) for code, _ in items)
+    lines = [
+        f"{'Code':<{max_code_len}}  Language",
+        '-' * (max_code_len + 2 + 50),  # 50 is a reasonable max for language names
+    ]
+    lines.extend(f"{code:<{max_code_len}}  {name}" for code, name in items)
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def install_uvloop() -> None:
+    """Use uvloop as the asyncio event loop policy when it is available.
     
-    for code, name in sorted(languages.items()):
-        print(f"{code:<{max_code_len}}  {name}")
+    uvloop is an optional dependency (the ``fast`` extra) and does not
+    support Windows; in either case the default event loop is kept.
+    """
+    if sys.platform == 'win32':
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+    logger.debug("Using uvloop event loop")
 
 
 def get_files_to_process(input_path: str, recursive: bool = False) -> List[Path]:
@@ -184,37 +258,107 @@ def get_files_to_process(input_path: str, recursive: bool = False) -> List[Path]
     Returns:
         List of files to process
     """
-    path = Path(input_path).expanduser().resolve()
+    path = Path(input_path).expanduser()
     
-    if not path.exists():
+    # A single stat answers both "does it exist" and "file or directory"
+    try:
+        mode = path.stat().st_mode
+    except FileNotFoundError:
         logger.error(f"Path does not exist: {path}")
         return []
     
-    if path.is_file():
+    if stat.S_ISREG(mode):
         return [path]
     
-    # Process directory
-    files = []
-    pattern = '**/*' if recursive else '*'
+    if not stat.S_ISDIR(mode):
+        return []
     
-    for ext in ['.srt', '.ass', '.ssa', '.vtt']:
-        files.extend(path.glob(f"{pattern}{ext}"))
+    # Process directory in a single pass, checking each entry's suffix once
+    files = []
+    if recursive:
+        for root, _dirs, names in os.walk(path):
+            files.extend(
+                Path(root, name) for name in names
+                if os.path.splitext(name)[1].lower() in SUBTITLE_EXTENSIONS
+            )
+    else:
+        with os.scandir(path) as entries:
+            files.extend(
+                Path(entry.path) for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in SUBTITLE_EXTENSIONS
+                and entry.is_file()
+            )
     
     return sorted(files)
 
 
+def get_output_file(input_file: Path, args: argparse.Namespace, config: ConfigManager) -> Path:
+    """Determine the output path for a translated file.
+    
+    Args:
+        input_file: Input file path
+        args: Command line arguments
+        config: Configuration manager
+        
+    Returns:
+        Output file path
+    """
+    if args.output:
+        output_path = Path(args.output)
+        if output_path.is_dir() or str(output_path).endswith('/'):
+            return output_path / input_file.name
+        return output_path
+    
+    # Add target language suffix
+    lang = args.target_lang or config.get('languages.target', 'translated')
+    return input_file.with_name(f"{input_file.stem}_{lang}{input_file.suffix}")
+
+
+def create_translation_config(config: ConfigManager, args: argparse.Namespace) -> Optional[TranslationConfig]:
+    """Build the translation configuration from the config file and CLI overrides.
+    
+    Args:
+        config: Configuration manager
+        args: Command line arguments
+        
+    Returns:
+        The translation configuration, or None if the languages are missing
+    """
+    source_lang = args.source_lang or config.get('languages.source')
+    target_lang = args.target_lang or config.get('languages.target')
+    
+    if not source_lang or not target_lang:
+        logger.error("Source and target languages must be specified")
+        return None
+    
+    return TranslationConfig(
+        translator_type=args.translator or config.get('translator.type'),
+        endpoint=args.endpoint or config.get('translator.endpoint'),
+        api_key=args.api_key or config.get('translator.api_key'),
+        batch_size=args.batch_size or config.get('translator.batch_size'),
+        timeout=args.timeout or config.get('translator.timeout'),
+        source_language=source_lang,
+        target_language=target_lang,
+        use_cache=not args.no_cache,
+        request_concurrency=args.request_concurrency or config.get('translator.request_concurrency'),
+        compress_requests=args.compress_requests or bool(config.get('translator.compress_requests')),
+        project_id=config.get('translator.project_id'),
+        location=config.get('translator.location') or 'global',
+    )
+
+
 async def process_file(
+    translator: Translator,
     input_file: Path,
     output_file: Path,
-    config: ConfigManager,
     args: argparse.Namespace
 ) -> bool:
     """Process a single subtitle file.
     
     Args:
+        translator: Translator shared by all files of the run
         input_file: Input file path
         output_file: Output file path
-        config: Configuration manager
         args: Command line arguments
         
     Returns:
@@ -228,58 +372,56 @@ async def process_file(
     # Ensure output directory exists
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
-    # Create translator config
-    translator_config = {
-        'type': args.translator or config.get('translator.type'),
-        'endpoint': args.endpoint or config.get('translator.endpoint'),
-        'api_key': args.api_key or config.get('translator.api_key'),
-        'batch_size': args.batch_size or config.get('translator.batch_size'),
-        'timeout': args.timeout or config.get('translator.timeout'),
-    }
-    
-    # Get languages
-    source_lang = args.source_lang or config.get('languages.source')
-    target_lang = args.target_lang or config.get('languages.target')
-    
-    if not source_lang or not target_lang:
-        logger.error("Source and target languages must be specified")
-        return False
-    
-    # Initialize translator
-    translator = Translator(
-        TranslationConfig(
-            endpoint=translator_config['endpoint'],
-            batch_size=translator_config['batch_size'],
-            timeout=translator_config['timeout'],
-            source_language=source_lang,
-            target_language=target_lang,
-        )
-    )
-    
     try:
         logger.info(f"Translating: {input_file} -> {output_file}")
-        logger.info(f"Language: {source_lang} -> {target_lang}")
+        logger.info(f"Language: {translator.config.source_language} -> {translator.config.target_language}")
         
         # Perform translation
-        result = await translator.translate_file(
-            input_file,
-            output_file,
-            source_language=source_lang,
-            target_language=target_lang
-        )
+        result = await translator.translate_file(input_file)
         
-        if result.success:
+        if result:
+            _, translated_subs = result
+            # Serialising and writing runs in an executor so the other files keep translating
+            await asyncio.get_running_loop().run_in_executor(None, translated_subs.save, str(output_file))
             logger.info(f"Successfully translated: {output_file}")
             return True
         else:
-            logger.error(f"Translation failed: {result.error}")
+            logger.error(f"Translation failed: {input_file}")
             return False
             
     except Exception as e:
         logger.error(f"Error processing {input_file}: {e}", exc_info=True)
         return False
-    finally:
-        await translator.close()
+
+
+async def process_files(
+    translation_config: TranslationConfig,
+    jobs: List[Tuple[Path, Path]],
+    args: argparse.Namespace
+) -> int:
+    """Translate all files with a single translator instance.
+    
+    Args:
+        translation_config: Translation configuration
+        jobs: (input file, output file) pairs to process
+        args: Command line arguments
+        
+    Returns:
+        int: Number of successfully processed files
+    """
+    semaphore = asyncio.Semaphore(max(1, args.concurrency or DEFAULT_CONCURRENCY))
+    
+    async with Translator(translation_config) as translator:
+        async def process_one(input_file: Path, output_file: Path) -> bool:
+            async with semaphore:
+                return await process_file(translator, input_file, output_file, args)
+        
+        results = await asyncio.gather(
+            *(process_one(input_file, output_file) for input_file, output_file in jobs),
+            return_exceptions=True
+        )
+    
+    return sum(1 for result in results if result is True)
 
 
 def main(args: Optional[List[str]] = None) -> int:
@@ -291,20 +433,32 @@ def main(args: Optional[List[str]] = None) -> int:
     Returns:
         int: Exit code (0 for success, non-zero for error)
     """
+    raw_args = sys.argv[1:] if args is None else list(args)
+    
+    # Fast paths that do not need the full argument parser
+    if '--version' in raw_args:
+        print(f"subtitle-translator {__version__}")
+        return 0
+    if '--list-languages' in raw_args and not {'-h', '--help'} & set(raw_args):
+        list_languages(ConfigManager.load_available_languages(_peek_option(raw_args, '--config')))
+        return 0
+    
     # Parse command line arguments
-    args = parse_args(args)
+    args = parse_args(raw_args)
     
     # Set up logging
     setup_logging(verbosity=args.verbose, quiet=args.quiet)
     
-    # Initialize config
-    config = ConfigManager(args.config)
-    
     # List languages and exit if requested
     if args.list_languages:
-        list_languages(config)
+        list_languages(ConfigManager.load_available_languages(args.config))
         return 0
     
+    ensure_directories()
+    
+    # Initialize config
+    config = ConfigManager(args.config)
+    
     # Validate input
     if not args.input:
         logger.error("Input file or directory is required")
@@ -316,25 +470,19 @@ def main(args: Optional[List[str]] = None) -> int:
         logger.error("No valid subtitle files found")
         return 1
     
-    # Process each file
-    success_count = 0
-    
-    for input_file in files:
-        # Determine output file path
-        if args.output:
-            output_path = Path(args.output)
-            if output_path.is_dir() or str(output_path).endswith('/'):
-                output_file = output_path / input_file.name
-            else:
-                output_file = output_path
-        else:
-            # Add target language suffix
-            lang = args.target_lang or config.get('languages.target', 'translated')
-            output_file = input_file.with_name(f"{input_file.stem}_{lang}{input_file.suffix}")
-        
-        # Process the file
-        if asyncio.run(process_file(input_file, output_file, config, args)):
-            success_count += 1
+    translation_config = create_translation_config(config, args)
+    if translation_config is None:
+        return 1
+    
+    jobs = [(input_file, get_output_file(input_file, args, config)) for input_file in files]
+    
+    # Process all files on one event loop with one translator
+    install_uvloop()
+    try:
+        success_count = asyncio.run(process_files(translation_config, jobs, args))
+    except ConfigurationError as e:
+        logger.error(str(e))
+        return 1
     
     # Print summary
     total = len(files)
@@ -354,6 +502,10 @@ def main(args: Optional[List[str]] = None) -> int:
             updates['translator.batch_size'] = args.batch_size
         if args.timeout:
             updates['translator.timeout'] = args.timeout
+        if args.request_concurrency:
+            updates['translator.request_concurrency'] = args.request_concurrency
+        if args.compress_requests:
+            updates['translator.compress_requests'] = True
         if args.source_lang:
             updates['languages.source'] = args.source_lang
         if args.target_lang:
@@ -2,20 +2,114 @@
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, Awaitable, Callable, List, Union
 import asyncio
+import functools
+import hashlib
 import json
 import logging
-from langdetect import detect
+import os
 import re
+import sys
+import time
+import warnings
 
 from ..utils.config import ConfigManager
-from ..translators import TranslatorFactory
-from .exceptions import TranslationError, ConfigurationError
+from ..utils.languages import iso_to_nllb
+from .exceptions import ConfigurationError
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# HTML-like tags, the characters that make up SRT cue headers (index and
+# timing lines) and control bytes, stripped from the raw language detection
+# sample. All of them are ASCII, so removing them cannot split a UTF-8 sequence.
+_TAG_RE = re.compile(rb'<[^>]+>')
+_SAMPLE_NOISE_BYTES = b'0123456789:,>-' + bytes(range(0, 9)) + bytes(range(14, 32))
+
+# Number of bytes sampled from the start of a file for language detection
+_DETECT_SAMPLE_SIZE = 16384
+
+# Translated subtitles, keyed by a hash of the input file and translation settings
+TRANSLATION_CACHE_DIR = Path.home() / '.cache' / 'subtitle-translator' / 'translations'
+
+# Most translated files kept in the cache; the oldest are removed first
+TRANSLATION_CACHE_MAX_FILES = 1000
+
+@functools.lru_cache(maxsize=1)
+def _get_detector_factory():
+    """Build the langdetect detector factory on first use.
+
+    Loading the language profiles is the expensive part of langdetect, so
+    callers that pass an explicit source language never pay for it. The
+    factory has a fixed seed so the same text always yields the same result,
+    which keeps the detection cache consistent.
+    """
+    from langdetect import DetectorFactory
+    from langdetect.detector_factory import PROFILES_DIRECTORY
+
+    factory = DetectorFactory()
+    factory.load_profile(PROFILES_DIRECTORY)
+    factory.set_seed(0)
+    return factory
+
+@functools.lru_cache(maxsize=1024)
+def _detect_file_language(file_path: str, mtime_ns: int, size: int) -> str:
+    """Detect the language of a subtitle file as an NLLB code.
+
+    The modification time and size are part of the cache key, so an edited
+    file is analysed again while repeated lookups of an unchanged file are free.
+    """
+    # A few KiB of dialogue is plenty for langdetect; an unbuffered binary
+    # read fetches the sample with a single read from the OS
+    with open(file_path, 'rb', buffering=0) as f:
+        raw = f.read(_DETECT_SAMPLE_SIZE)
+
+    # Remove HTML-like tags, timestamps and other SRT artifacts before decoding
+    # so only the remaining text is decoded
+    raw = _TAG_RE.sub(b' ', raw).translate(None, _SAMPLE_NOISE_BYTES)
+    text = raw.decode('utf-8', errors='ignore')
+
+    # Detect the language and map it to NLLB, defaulting to English if not found
+    detector = _get_detector_factory().create()
+    detector.append(text)
+    return iso_to_nllb(detector.detect())
+
+@functools.lru_cache(maxsize=1024)
+def _file_digest(file_path: str, mtime_ns: int, size: int) -> str:
+    """Hash a file's contents; cached on its modification time and size."""
+    with open(file_path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+def _prune_cache_dir(directory: Path, max_files: int) -> None:
+    """Remove the oldest files of a cache directory beyond ``max_files``."""
+    with os.scandir(directory) as entries:
+        files = [(entry.stat().st_mtime, entry.path) for entry in entries if entry.is_file()]
+    if len(files) <= max_files:
+        return
+    files.sort()
+    for _, path in files[:len(files) - max_files]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def _async_closer(backend) -> Optional[Callable[[], Awaitable[Any]]]:
+    """Return a coroutine function that closes ``backend``, or None if it has no close().
+
+    Synchronous close() methods are wrapped so callers can always await the result.
+    """
+    close = getattr(backend, 'close', None)
+    if close is None or asyncio.iscoroutinefunction(close):
+        return close
+
+    async def _close_sync():
+        return close()
+    return _close_sync
+
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+)
+_DATACLASS_OPTIONS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class TranslationConfig:
     """Configuration for subtitle translation."""
     translator_type: str = "local_nllb"
@@ -29,8 +123,15 @@ class TranslationConfig:
     retry_delay: int = 5
     gemini_prompt_template: str = "Translate the following text from {source_language} to {target_language}. Please provide only the translated text, without any additional explanations or context. Maintain the original meaning and tone as much as possible."
     gemini_tone: str = ""
+    use_cache: bool = True
+    cache_path: Optional[str] = None  # Line cache database; defaults to ~/.cache/subtitle-translator/lines.sqlite3
+    cache_ttl: Optional[int] = None  # Seconds a cached line or file stays valid; None keeps it forever
+    request_concurrency: Optional[int] = None  # Requests a backend sends at once; None uses its default
+    compress_requests: bool = False  # Gzip request bodies (local NLLB and Hugging Face; the server must accept it)
+    project_id: Optional[str] = None  # Google Cloud project; defaults to GOOGLE_CLOUD_PROJECT or the credentials
+    location: str = "global"  # Google Cloud Translation location
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TranslationResult:
     """Result of a translation operation."""
     success: bool
@@ -48,136 +149,57 @@ class Translator:
         """Initialize the translator with the given configuration."""
         self.config = config or TranslationConfig()
         self.translator = None
+        self._close = None
+        # Tasks closing replaced backends; kept so they are not garbage-collected while running
+        self._close_tasks = set()
         self._initialize_translator()
     
     def _initialize_translator(self):
         """Initialize the underlying translator engine."""
+        # Imported here so that backend SDKs are only loaded once a translator is needed
+        from ..translators import TranslatorFactory
+
         try:
-            translator_config = {
-                'endpoint': self.config.endpoint,
-                'api_key': self.config.api_key,
-                'batch_size': self.config.batch_size,
-                'timeout': self.config.timeout,
-                'source_language': self.config.source_language,
-                'target_language': self.config.target_language,
-                'prompt_template': self.config.gemini_prompt_template,
-                'tone': self.config.gemini_tone
-            }
             self.translator = TranslatorFactory.create_translator(
                 self.config.translator_type,
-                translator_config
+                self._translator_config()
             )
         except Exception as e:
-            logger.error(f"Failed to initialize translator: {e}")
+            logger.error("Failed to initialize translator: %s", e)
             raise ConfigurationError(f"Failed to initialize translator: {e}")
+        self._close = _async_closer(self.translator)
 
-    def _detect_language(self, file_path: Path) -> str:
-        """Detect the language of a subtitle file."""
+    def _translator_config(self) -> Dict[str, Any]:
+        """Build the configuration dictionary passed to the backend."""
+        return {
+            'endpoint': self.config.endpoint,
+            'api_key': self.config.api_key,
+            'batch_size': self.config.batch_size,
+            'timeout': self.config.timeout,
+            'source_language': self.config.source_language,
+            'target_language': self.config.target_language,
+            'prompt_template': self.config.gemini_prompt_template,
+            'tone': self.config.gemini_tone,
+            'use_cache': self.config.use_cache,
+            'cache_path': self.config.cache_path,
+            'cache_ttl': self.config.cache_ttl,
+            'concurrency': self.config.request_concurrency,
+            'compress_requests': self.config.compress_requests,
+            'project_id': self.config.project_id,
+            'location': self.config.location
+        }
+
+    def _detect_language(self, file_path: Path, st: Optional[os.stat_result] = None) -> str:
+        """Detect the language of a subtitle file.
+
+        ``st`` may be passed in by callers that have already stat'ed the file.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                # Read a sample of the file (e.g., the first 100 lines)
-                lines = [next(f) for _ in range(100)]
-            
-            # Join the lines and remove timestamps and other SRT artifacts
-            text = " ".join(lines)
-            text = re.sub(r'\d+\n\d{2}:\d{2}:\d{2},\d{3} --> \d{2}:\d{2}:\d{2},\d{3}\n', '', text)
-            text = re.sub(r'<[^>]+>', '', text)  # Remove HTML-like tags
-            
-            # Detect the language
-            lang = detect(text)
-            
-            # Map to NLLB language codes (ISO 639-1 to NLLB format)
-            lang_map = {
-                # Major European languages
-                'en': 'eng_Latn',  # English
-                'es': 'spa_Latn',  # Spanish
-                'fr': 'fra_Latn',  # French
-                'de': 'deu_Latn',  # German
-                'it': 'ita_Latn',  # Italian
-                'pt': 'por_Latn',  # Portuguese
-                'ru': 'rus_Cyrl',  # Russian
-                'nl': 'nld_Latn',  # Dutch
-                'pl': 'pol_Latn',  # Polish
-                'uk': 'ukr_Cyrl',  # Ukrainian
-                'tr': 'tur_Latn',  # Turkish
-                'ar': 'arb_Arab',  # Arabic
-                'zh': 'zho_Hans',  # Chinese Simplified
-                'zh-tw': 'zho_Hant',  # Chinese Traditional
-                'ja': 'jpn_Jpan',  # Japanese
-                'ko': 'kor_Hang',  # Korean
-                'hi': 'hin_Deva',  # Hindi
-                'bn': 'ben_Beng',  # Bengali
-                'pa': 'pan_Guru',  # Punjabi
-                'ta': 'tam_Taml',  # Tamil
-                'te': 'tel_Telu',  # Telugu
-                'mr': 'mar_Deva',  # Marathi
-                'vi': 'vie_Latn',  # Vietnamese
-                'th': 'tha_Thai',  # Thai
-                'id': 'ind_Latn',  # Indonesian
-                'ms': 'zsm_Latn',  # Malay
-                'fil': 'tgl_Latn',  # Filipino
-                'sw': 'swh_Latn',  # Swahili
-                'ha': 'hau_Latn',  # Hausa
-                'yo': 'yor_Latn',  # Yoruba
-                'ig': 'ibo_Latn',  # Igbo
-                'am': 'amh_Ethi',  # Amharic
-                'zu': 'zul_Latn',  # Zulu
-                'xh': 'xho_Latn',  # Xhosa
-                'st': 'sot_Latn',  # Southern Sotho
-                'tn': 'tsn_Latn',  # Tswana
-                'sn': 'sna_Latn',  # Shona
-                'rw': 'kin_Latn',  # Kinyarwanda
-                'mg': 'plt_Latn',  # Malagasy
-                'so': 'som_Latn',  # Somali
-                'om': 'gaz_Latn',  # Oromo
-                'ti': 'tir_Ethi',  # Tigrinya
-                'he': 'heb_Hebr',  # Hebrew
-                'fa': 'pes_Arab',  # Persian
-                'ur': 'urd_Arab',  # Urdu
-                'ps': 'pbt_Arab',  # Pashto
-                'ku': 'kmr_Latn',  # Kurdish (Kurmanji)
-                'ckb': 'ckb_Arab',  # Central Kurdish
-                'ne': 'npi_Deva',  # Nepali
-                'si': 'sin_Sinh',  # Sinhala
-                'km': 'khm_Khmr',  # Khmer
-                'lo': 'lao_Laoo',  # Lao
-                'my': 'mya_Mymr',  # Burmese
-                'ka': 'kat_Geor',  # Georgian
-                'hy': 'hye_Armn',  # Armenian
-                'az': 'azj_Latn',  # Azerbaijani
-                'uz': 'uzn_Latn',  # Uzbek
-                'kk': 'kaz_Cyrl',  # Kazakh
-                'ky': 'kir_Cyrl',  # Kyrgyz
-                'tg': 'tgk_Cyrl',  # Tajik
-                'tk': 'tuk_Latn',  # Turkmen
-                'mn': 'khk_Cyrl',  # Mongolian
-                'bo': 'bod_Tibt',  # Tibetan
-                'dz': 'dzo_Tibt',  # Dzongkha
-                'ceb': 'ceb_Latn',  # Cebuano
-                'jv': 'jav_Latn',  # Javanese
-                'su': 'sun_Latn',  # Sundanese
-                'ml': 'mal_Mlym',  # Malayalam
-                'kn': 'kan_Knda',  # Kannada
-                'gu': 'guj_Gujr',  # Gujarati
-                'or': 'ory_Orya',  # Odia
-                'as': 'asm_Beng',  # Assamese
-                'mai': 'mai_Deva',  # Maithili
-                'sd': 'snd_Arab',  # Sindhi
-                'pa': 'pan_Guru',  # Punjabi (Gurmukhi)
-                'si': 'sin_Sinh',  # Sinhala
-                'my': 'mya_Mymr',  # Burmese
-                'km': 'khm_Khmr',  # Khmer
-                'lo': 'lao_Laoo',  # Lao
-                'th': 'tha_Thai',  # Thai
-                'bo': 'bod_Tibt',  # Tibetan
-                'dz': 'dzo_Tibt',  # Dzongkha
-            }
-            
-            # Return the mapped language or default to English if not found
-            return lang_map.get(lang, 'eng_Latn')
-            
+            if st is None:
+                st = file_path.stat()
+            return _detect_file_language(str(file_path), st.st_mtime_ns, st.st_size)
         except Exception as e:
-            logger.warning(f"Language detection failed for {file_path}: {e}. Defaulting to English.")
+            logger.warning("Language detection failed for %s: %s. Defaulting to English.", file_path, e)
             return 'eng_Latn'
 
     async def translate_file(
@@ -190,43 +212,210 @@ class Translator:
         """
         Translate a subtitle file.
         """
-        input_path = Path(input_file)
-        if not input_path.exists():
-            raise FileNotFoundError(f"Input file not found: {input_path}")
+        input_path = input_file if isinstance(input_file, Path) else Path(input_file)
+        # One stat() both checks that the file exists and keys the detection cache
+        try:
+            st = input_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Input file not found: {input_path}") from None
+
+        # File reads and subtitle parsing below run in the default executor so
+        # they do not stall other translations on the event loop
+        loop = asyncio.get_running_loop()
 
         src_lang = source_language or self.config.source_language
         if src_lang == 'auto':
-            src_lang = self._detect_language(input_path)
-            logger.info(f"Detected source language for {input_path.name}: {src_lang}")
+            src_lang = await loop.run_in_executor(None, self._detect_language, input_path, st)
+            logger.info("Detected source language for %s: %s", input_path.name, src_lang)
 
         tgt_lang = target_language or self.config.target_language
 
+        # Backend-specific keyword arguments may change the output, so such
+        # calls bypass the cache
+        cache_path = None
+        if self.config.use_cache and not kwargs:
+            try:
+                cache_path, cached = await loop.run_in_executor(
+                    None, self._lookup_cache, input_path, st, src_lang, tgt_lang
+                )
+                if cached is not None:
+                    logger.info("Using cached translation for %s", input_path.name)
+                    return cached
+            except Exception as e:
+                logger.warning("Translation cache lookup failed for %s: %s", input_path.name, e)
+
         try:
-            return await self.translator.translate_file(
+            result = await self.translator.translate_file_with_status(
                 input_path,
                 source_language=src_lang,
                 target_language=tgt_lang,
                 **kwargs
             )
         except Exception as e:
-            logger.error(f"Translation failed: {e}", exc_info=True)
+            # Tracebacks only at debug level, so a flapping endpoint does not flood the log
+            logger.error("Translation failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
-    
+
+        if result is None:
+            return None
+        original_subs, translated_subs, complete = result
+
+        # A file with lines that failed to translate is not cached, so the
+        # next run translates them again
+        if complete and cache_path is not None:
+            try:
+                await loop.run_in_executor(None, self._store_cached, cache_path, translated_subs)
+            except Exception as e:
+                logger.warning("Could not cache translation of %s: %s", input_path.name, e)
+        return original_subs, translated_subs
+
+    def _cache_path(
+        self,
+        input_path: Path,
+        st: os.stat_result,
+        source_language: str,
+        target_language: str
+    ) -> Path:
+        """Get the cache entry for a file translated with the current settings."""
+        digest = _file_digest(str(input_path), st.st_mtime_ns, st.st_size)
+        settings = json.dumps([
+            digest,
+            self.config.translator_type,
+            self.config.endpoint,
+            self.config.gemini_prompt_template,
+            self.config.gemini_tone,
+            source_language,
+            target_language,
+        ])
+        key = hashlib.blake2b(settings.encode('utf-8'), digest_size=16).hexdigest()
+        return TRANSLATION_CACHE_DIR / f"{key}{input_path.suffix.lower()}"
+
+    def _lookup_cache(
+        self,
+        input_path: Path,
+        st: os.stat_result,
+        source_language: str,
+        target_language: str
+    ) -> tuple:
+        """Find the cache entry for a file.
+
+        Returns:
+            The cache path and the loaded (original, translated) subtitles, or
+            None in their place if the entry does not exist yet or has expired
+        """
+        cache_path = self._cache_path(input_path, st, source_language, target_language)
+        try:
+            cached_mtime = cache_path.stat().st_mtime
+        except FileNotFoundError:
+            return cache_path, None
+        if self.config.cache_ttl and time.time() - cached_mtime > self.config.cache_ttl:
+            return cache_path, None
+        return cache_path, self._load_cached(input_path, cache_path)
+
+    @staticmethod
+    def _load_cached(input_path: Path, cache_path: Path):
+        """Load the original subtitles and their cached translation."""
+        import pysubs2
+
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=RuntimeWarning)
+            original_subs = pysubs2.load(str(input_path), encoding="utf-8")
+            translated_subs = pysubs2.load(str(cache_path), encoding="utf-8")
+        return original_subs, translated_subs
+
+    @staticmethod
+    def _store_cached(cache_path: Path, translated_subs) -> None:
+        """Atomically write a translation into the cache."""
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Keep the subtitle extension so pysubs2 writes the same format
+        tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.tmp{cache_path.suffix}")
+        translated_subs.save(str(tmp_path), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+        _prune_cache_dir(cache_path.parent, TRANSLATION_CACHE_MAX_FILES)
+
+    async def translate_files(
+        self,
+        inputs: List[Union[str, Path]],
+        concurrency: Optional[int] = None,
+        **kwargs
+    ) -> List[Any]:
+        """
+        Translate several subtitle files concurrently.
+
+        At most ``concurrency`` files (defaulting to the configured batch size)
+        are in flight at once. Results are returned in the order of ``inputs``;
+        an entry is None if that file failed to translate. With an 'auto'
+        source language, all files are detected up front in one pass.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency or self.config.batch_size))
+
+        source_languages = [kwargs.pop('source_language', None) or self.config.source_language] * len(inputs)
+        if source_languages and source_languages[0] == 'auto':
+            source_languages = await self._detect_languages(inputs)
+
+        async def _translate_one(input_file, source_language):
+            async with semaphore:
+                return await self.translate_file(input_file, source_language=source_language, **kwargs)
+
+        return await asyncio.gather(*(
+            _translate_one(p, lang) for p, lang in zip(inputs, source_languages)
+        ))
+
+    async def _detect_languages(self, inputs: List[Union[str, Path]]) -> List[str]:
+        """Detect the languages of several files, reading them in parallel threads."""
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(*(
+            loop.run_in_executor(
+                None, self._detect_language, p if isinstance(p, Path) else Path(p)
+            )
+            for p in inputs
+        ))
+
     def update_config(self, **kwargs):
-        """Update the translator configuration."""
+        """Update the translator configuration.
+
+        Settings the backend can take in place (such as the languages or the
+        batch size) are rebound on the existing backend, keeping its
+        connections. Otherwise a new backend is created and the replaced one
+        is closed in the background when an event loop is running.
+        """
+        previous_type = self.config.translator_type
         for key, value in kwargs.items():
             if hasattr(self.config, key):
                 setattr(self.config, key, value)
         
+        if (self.config.translator_type == previous_type
+                and self.translator.rebind(self._translator_config())):
+            return
+
+        old_close = self._close
         self._initialize_translator()
-    
+        if old_close is not None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # No running loop to close it on; its sessions are released when collected
+                return
+            task = loop.create_task(old_close())
+            self._close_tasks.add(task)
+            task.add_done_callback(self._close_done)
+
+    def _close_done(self, task: asyncio.Task) -> None:
+        """Forget a finished close task, logging its failure."""
+        self._close_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Closing the replaced translator failed: %s", task.exception())
+
     async def close(self):
-        """Close any resources used by the translator."""
-        if hasattr(self.translator, 'close'):
-            if asyncio.iscoroutinefunction(self.translator.close):
-                await self.translator.close()
-            else:
-                self.translator.close()
+        """Close any resources used by the translator.
+
+        Replaced backends still being closed are waited for. Safe to call
+        more than once.
+        """
+        if self._close_tasks:
+            await asyncio.gather(*self._close_tasks, return_exceptions=True)
+        if self._close is not None:
+            await self._close()
 
     async def __aenter__(self):
         return self
@@ -1,36 +1,48 @@
 """Main GUI module for the subtitle translator."""
 import time
 import asyncio
+import concurrent.futures
+import dataclasses
+import functools
 import logging
+import multiprocessing
 import os
 import sys
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
 # Core Qt imports
-from PyQt6.QtCore import (
-    Qt, QSize, QThread, pyqtSignal, pyqtSlot, QObject, QTimer, QSettings, 
-    QDateTime, QVariantAnimation, QCoreApplication, QEvent, QMimeData, QUrl
-)
-from PyQt6.QtGui import (
-    QAction, QIcon, QFont, QDragEnterEvent, QDropEvent, QStandardItemModel,
-    QStandardItem, QTextCursor, QPixmap, QFontMetrics, QPalette, QColor,
-    QGuiApplication, QFontDatabase, QPainter
-)
-from PyQt6.QtWidgets import (
-    QTableView,
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QFileDialog, QComboBox, QSpinBox, QLineEdit, QTextEdit,
-    QProgressBar, QStatusBar, QSplitter, QToolBar, QMenuBar, QMenu,
-    QMessageBox, QListWidget, QListWidgetItem, QStyle, QSizePolicy,
-    QFrame, QDialog, QDialogButtonBox, QFormLayout, QCheckBox, QGroupBox,
-    QTabWidget, QScrollArea, QStyleFactory, QStyleOption, QStylePainter,
-    QStyledItemDelegate, QAbstractItemView, QToolButton, QSystemTrayIcon
-)
+try:
+    from PyQt6.QtCore import (
+        Qt, QSize, QThread, pyqtSignal, pyqtSlot, QObject, QTimer, QSettings, 
+        QDateTime, QVariantAnimation, QCoreApplication, QEvent, QMimeData, QUrl,
+        QAbstractTableModel, QAbstractListModel, QModelIndex, QThreadPool
+    )
+    from PyQt6.QtGui import (
+        QAction, QIcon, QFont, QDragEnterEvent, QDropEvent,
+        QTextCursor, QTextCharFormat, QPixmap, QFontMetrics, QPalette, QColor,
+        QGuiApplication, QFontDatabase, QPainter
+    )
+    from PyQt6.QtWidgets import (
+        QTableView,
+        QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+        QPushButton, QFileDialog, QComboBox, QSpinBox, QLineEdit, QTextEdit,
+        QPlainTextEdit,
+        QProgressBar, QStatusBar, QSplitter, QToolBar, QMenuBar, QMenu,
+        QMessageBox, QListView, QStyle, QSizePolicy,
+        QFrame, QDialog, QDialogButtonBox, QFormLayout, QCheckBox, QGroupBox,
+        QTabWidget, QScrollArea, QStyleFactory, QStyleOption, QStylePainter,
+        QStyledItemDelegate, QAbstractItemView, QToolButton, QSystemTrayIcon
+    )
+except ImportError as e:
+    raise ImportError(
+        "The subtitle translator GUI requires PyQt6. "
+        "Install it with: pip install 'subtitle-translator[gui]'"
+    ) from e
 
 from ..core import Translator, TranslationConfig, TranslationResult
 from ..utils.config import ConfigManager
-from .. import __version__
+from .. import __version__, ensure_directories
 
 class QtLogHandler(logging.Handler, QObject):
     """A logging handler that emits a Qt signal."""
@@ -46,6 +58,134 @@ class QtLogHandler(logging.Handler, QObject):
 
 logger = logging.getLogger(__name__)
 
+# Translator backends offered in the GUI as (label, translator type)
+TRANSLATOR_CHOICES = (
+    ("Local NLLB Server", "local_nllb"),
+    ("Hugging Face API", "huggingface"),
+    ("Google Translate", "google"),
+    ("DeepL", "deepl"),
+    ("Gemini", "gemini"),
+)
+
+# Subtitle file extensions the GUI accepts
+SUBTITLE_EXTENSIONS = frozenset({'.srt', '.ass', '.ssa', '.vtt'})
+
+# How long the settings must be left unchanged before they are applied
+SETTINGS_DEBOUNCE_MS = 300
+
+# How long log messages are collected before being written to the log widget
+LOG_FLUSH_INTERVAL_MS = 50
+
+# How often the progress bar and status label are updated during a translation
+PROGRESS_UPDATE_INTERVAL_MS = 50
+
+# Maximum number of lines kept in the log widget
+LOG_MAX_LINES = 5000
+
+# Text colour of log messages by level, and of their timestamps
+LOG_COLORS = {
+    'info': '#FFFFFF',
+    'warning': '#FFA500',
+    'error': '#FF4500',
+    'success': '#32CD32',
+}
+LOG_TIMESTAMP_COLOR = '#888888'
+
+
+def _iter_subtitle_files(folder: str):
+    """Yield the paths of all subtitle files below ``folder``.
+
+    The tree is walked once, checking each file name's extension, instead of
+    globbing it again for every extension.
+    """
+    for dirpath, _dirnames, filenames in os.walk(folder):
+        for name in filenames:
+            if os.path.splitext(name)[1].lower() in SUBTITLE_EXTENSIONS:
+                yield os.path.join(dirpath, name)
+
+
+def _ensure_directory(path: str) -> None:
+    """Create a directory and its parents, logging instead of raising on failure."""
+    try:
+        Path(path).mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.warning(f"Could not create output directory {path}: {e}")
+
+
+# Fonts are built on first use rather than at import, since Qt requires the
+# QApplication to exist first; afterwards the same instance is reused
+
+@functools.lru_cache(maxsize=None)
+def _application_font() -> QFont:
+    """Get the application-wide UI font."""
+    font = QFont()
+    font.setFamily('Segoe UI' if sys.platform == 'win32' else 'Arial')
+    font.setPointSize(10)
+    return font
+
+
+@functools.lru_cache(maxsize=None)
+def _monospace_font() -> QFont:
+    """Get the monospace font used for the log."""
+    font = QFont('Menlo' if sys.platform == 'darwin' else 'Courier New')
+    font.setStyleHint(QFont.StyleHint.Monospace)
+    return font
+
+
+def _char_format(color: str) -> QTextCharFormat:
+    """Create a text format with the given foreground colour."""
+    text_format = QTextCharFormat()
+    text_format.setForeground(QColor(color))
+    return text_format
+
+# Language codes recognised as a suffix of input file names
+_LANG_CODES = frozenset({
+    'eng', 'spa', 'nld', 'deu', 'fra', 'ita', 'por', 'rus', 'jpn', 'kor',
+    'zho', 'ara', 'tur', 'pol', 'ukr', 'swe', 'dan', 'nor', 'fin', 'hun',
+    'ces', 'ron', 'ell', 'bul', 'srp', 'hrv', 'slv', 'mkd', 'bos',
+})
+
+
+def _strip_lang_code(stem: str) -> Optional[str]:
+    """Remove a trailing ``[._]<code>`` (optionally ``[._]trackN[._]<code>``).
+
+    Returns None if the stem does not end in a known language code.
+    """
+    i = max(stem.rfind('.'), stem.rfind('_'))
+    if i < 0 or stem[i + 1:].lower() not in _LANG_CODES:
+        return None
+    prefix = stem[:i]
+    j = max(prefix.rfind('.'), prefix.rfind('_'))
+    token = prefix[j + 1:]
+    if j >= 0 and token[:5].lower() == 'track' and token[5:].isdecimal():
+        return prefix[:j]
+    return prefix
+
+
+def _strip_lang_suffix(stem: str) -> str:
+    """Remove a language suffix such as ``_eng``, ``.eng``, ``.track2_eng`` or
+    ``_eng_Latn`` from a file stem."""
+    # A trailing 4-5 letter script tag only counts when a language code precedes it
+    head, sep, tail = stem.rpartition('_')
+    if sep and 4 <= len(tail) <= 5 and tail.isascii() and tail.isalpha():
+        stripped = _strip_lang_code(head)
+        if stripped is not None:
+            return stripped
+    stripped = _strip_lang_code(stem)
+    return stem if stripped is None else stripped
+
+
+@functools.lru_cache(maxsize=4096)
+def _translated_file_name(stem: str, suffix: str, target_language: Optional[str]) -> str:
+    """Build the output file name for a translated subtitle.
+
+    Any language code is removed from the input stem (e.g. ``_eng``, ``.eng``,
+    ``track2_eng``) and the first three characters of the target language
+    (e.g. ``'spa_Latn'`` -> ``'spa'``) are appended instead.
+    """
+    lang_code = target_language[:3] if target_language else 'trans'
+    return f"{_strip_lang_suffix(stem)}_{lang_code}{suffix}"
+
 # High DPI scaling is now handled by Qt attributes
 
 # Set the application style
@@ -55,10 +195,7 @@ def set_application_style(app):
     app.setStyle(QStyleFactory.create('Fusion'))
     
     # Set a consistent font
-    font = QFont()
-    font.setFamily('Segoe UI' if sys.platform == 'win32' else 'Arial')
-    font.setPointSize(10)
-    app.setFont(font)
+    app.setFont(_application_font())
     
     # Set the application palette
     palette = app.palette()
@@ -107,33 +244,46 @@ def set_application_style(app):
         app.setPalette(light_palette)
 
 
-class AsyncRunner(QObject):
-    """Runs an async function in a separate thread's event loop."""
-    started = pyqtSignal()
-    finished = pyqtSignal()
+class AsyncLoopThread(QThread):
+    """Runs a single asyncio event loop for the lifetime of the application.
 
-    def __init__(self, coro, *args, **kwargs):
-        super().__init__()
-        self._coro = coro
-        self._args = args
-        self._kwargs = kwargs
+    Translation jobs are submitted to this loop instead of each starting its
+    own, so the translator's HTTP session and keep-alive connections are
+    reused from one job to the next.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.loop = asyncio.new_event_loop()
 
     def run(self):
-        """Run the coroutine."""
-        self.started.emit()
+        """Run the event loop until stop() is called."""
+        asyncio.set_event_loop(self.loop)
         try:
-            asyncio.run(self._coro(*self._args, **self._kwargs))
+            self.loop.run_forever()
         finally:
-            self.finished.emit()
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            self.loop.close()
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        """Schedule a coroutine on the loop from any thread."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self):
+        """Stop the loop and wait for the thread to finish."""
+        if self.isRunning():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.wait()
 
 class TranslationWorker(QObject):
-    """Worker for handling translation in a separate thread."""
+    """Worker for handling translation on the application's asyncio loop."""
     
     # Signals
     progress_updated = pyqtSignal(int, int, str)  # current, total, status
     translation_complete = pyqtSignal(bool, str)   # success, message
     review_ready = pyqtSignal(object, object, object) # original_subs, translated_subs, output_path
     error_occurred = pyqtSignal(str)               # error message
+    finished = pyqtSignal()                        # run_translation returned or was cancelled
     
     def __init__(self, translator: Translator, files: List[Path], output_dir: Path):
         """Initialize the translation worker."""
@@ -144,64 +294,70 @@ class TranslationWorker(QObject):
         self._is_running = True
     
     def stop(self):
-        """Stop the translation process."""
+        """Stop the translation process; files already in flight still finish."""
         self._is_running = False
-        if self.translator and hasattr(self.translator, 'close'):
-            if asyncio.iscoroutinefunction(self.translator.close):
-                asyncio.run(self.translator.close())
-            else:
-                self.translator.close()
-
 
     async def run_translation(self):
-        """Run the translation process."""
+        """Run the translation process.
+
+        Up to ``batch_size`` files are translated concurrently; progress is
+        reported as each file finishes.
+        """
         total = len(self.files)
         success_count = 0
+        completed = 0
         
         logger.info(f"Starting translation of {total} files...")
         start_time = time.time()
+        semaphore = asyncio.Semaphore(max(1, self.translator.config.batch_size))
         
-        try:
-            for i, input_file in enumerate(self.files, 1):
+        # Read once so every file in the job uses the same settings
+        translator = self.translator
+        source_language = translator.config.source_language
+        target_language = translator.config.target_language
+        output_dir = self.output_dir
+        
+        async def _translate_one(input_file: Path) -> bool:
+            async with semaphore:
                 if not self._is_running:
-                    logger.warning("Translation cancelled by user.")
-                    break
+                    return False
                 
                 file_start_time = time.time()
-                self.progress_updated.emit(i, total, f"Translating {input_file.name}...")
-                
-                # Create output filename by removing any language code and adding target language
-                import re
-                stem = input_file.stem
-                # Remove any existing language code (e.g., _eng, .eng, track2_eng, etc.)
-                stem = re.sub(r'[._](eng|spa|nld|deu|fra|ita|por|rus|jpn|kor|zho|ara|tur|pol|ukr|swe|dan|nor|fin|hun|ces|ron|ell|bul|srp|hrv|slv|mkd|bos)(?:_[A-Za-z]{4,5})?$', '', stem)
-                stem = re.sub(r'[._]track\d+[._](eng|spa|nld|deu|fra|ita|por|rus|jpn|kor|zho|ara|tur|pol|ukr|swe|dan|nor|fin|hun|ces|ron|ell|bul|srp|hrv|slv|mkd|bos)(?:_[A-Za-z]{4,5})?$', '', stem)
-                # Add the target language code (first 3 chars of target_language, e.g., 'spa_Latn' -> 'spa')
-                lang_code = self.translator.config.target_language[:3] if self.translator.config.target_language else 'trans'
-                output_file = self.output_dir / f"{stem}_{lang_code}{input_file.suffix}"
+                output_file = output_dir / _translated_file_name(
+                    input_file.stem, input_file.suffix, target_language
+                )
                 
                 try:
-                    translation_result = await self.translator.translate_file(
+                    translation_result = await translator.translate_file(
                         input_file,
-                        source_language=self.translator.config.source_language,
-                        target_language=self.translator.config.target_language
+                        source_language=source_language,
+                        target_language=target_language
                     )
 
                     if translation_result:
                         original_subs, translated_subs = translation_result
                         self.review_ready.emit(original_subs, translated_subs, output_file)
-                        success_count += 1
                         file_time = time.time() - file_start_time
                         logger.info(f"Successfully translated {input_file.name} in {file_time:.2f}s. Ready for review.")
-                    else:
-                        error_msg = f"Failed to translate {input_file.name}"
-                        logger.error(error_msg)
-                        self.error_occurred.emit(error_msg)
+                        return True
+                    
+                    error_msg = f"Failed to translate {input_file.name}"
+                    logger.error(error_msg)
+                    self.error_occurred.emit(error_msg)
                 
                 except Exception as e:
                     error_msg = f"Error translating {input_file.name}: {str(e)}"
                     logger.error(error_msg, exc_info=True)
                     self.error_occurred.emit(error_msg)
+                return False
+        
+        tasks = [asyncio.ensure_future(_translate_one(input_file)) for input_file in self.files]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                if await next_done:
+                    success_count += 1
+                completed += 1
+                self.progress_updated.emit(completed, total, f"Translated {completed} of {total} files...")
             
             total_time = time.time() - start_time
             if self._is_running:
@@ -212,12 +368,120 @@ class TranslationWorker(QObject):
                     logger.warning(msg)
                 self.translation_complete.emit(success_count > 0, msg)
             else:
+                logger.warning("Translation cancelled by user.")
                 self.translation_complete.emit(False, "Translation cancelled.")
                 
+        except asyncio.CancelledError:
+            logger.warning("Translation cancelled by user.")
+            raise
         except Exception as e:
             logger.error(f"An unexpected error occurred: {e}", exc_info=True)
             self.error_occurred.emit(f"Unexpected error: {str(e)}")
             self.translation_complete.emit(False, "Translation failed.")
+        finally:
+            # Cancelling the job cancels only this coroutine; stop the file tasks too
+            for task in tasks:
+                task.cancel()
+            self.finished.emit()
+
+
+class SubtitleReviewModel(QAbstractTableModel):
+    """Table model showing original and translated subtitle lines side by side.
+
+    Rows are read straight from the subtitle objects when the view asks for
+    them, and edits are written back to the translated subtitles in place.
+    """
+
+    HEADERS = ("Original Text", "Translated Text")
+
+    def __init__(self, original_subs, translated_subs, parent=None):
+        super().__init__(parent)
+        self.original_subs = original_subs
+        self.translated_subs = translated_subs
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.original_subs)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return None
+        subs = self.original_subs if index.column() == 0 else self.translated_subs
+        return subs[index.row()].text
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or index.column() != 1 or role != Qt.ItemDataRole.EditRole:
+            return False
+        self.translated_subs[index.row()].text = value
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+        return True
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and index.column() == 1:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class SubtitleFileListModel(QAbstractListModel):
+    """List model over the paths of the files queued for translation.
+
+    Rows show the file name, with the full path as tooltip and user data.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._paths: List[str] = []
+        self._path_set = set()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._paths)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        path = self._paths[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return os.path.basename(path)
+        if role in (Qt.ItemDataRole.ToolTipRole, Qt.ItemDataRole.UserRole):
+            return path
+        return None
+
+    def paths(self) -> List[str]:
+        """Get the queued file paths in order."""
+        return list(self._paths)
+
+    def add_paths(self, paths: List[str]) -> int:
+        """Append the paths that are not queued yet, in one insertion.
+
+        Returns:
+            The number of paths added
+        """
+        new_paths = []
+        for path in paths:
+            if path not in self._path_set:
+                self._path_set.add(path)
+                new_paths.append(path)
+        if new_paths:
+            first = len(self._paths)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_paths) - 1)
+            self._paths.extend(new_paths)
+            self.endInsertRows()
+        return len(new_paths)
+
+    def clear(self):
+        """Remove all paths."""
+        self.beginResetModel()
+        self._paths.clear()
+        self._path_set.clear()
+        self.endResetModel()
 
 
 class ReviewWindow(QDialog):
@@ -236,19 +500,11 @@ class ReviewWindow(QDialog):
 
         # Table view for side-by-side comparison
         self.table_view = QTableView()
-        self.model = QStandardItemModel()
-        self.model.setHorizontalHeaderLabels(["Original Text", "Translated Text"])
+        self.model = SubtitleReviewModel(self.original_subs, self.translated_subs, self)
         self.table_view.setModel(self.model)
         self.table_view.horizontalHeader().setStretchLastSection(True)
         self.layout().addWidget(self.table_view)
 
-        # Populate the model
-        for i in range(len(self.original_subs)):
-            original_item = QStandardItem(self.original_subs[i].text)
-            translated_item = QStandardItem(self.translated_subs[i].text)
-            original_item.setFlags(original_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.model.appendRow([original_item, translated_item])
-
         # Buttons
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel)
         button_box.accepted.connect(self.accept)
@@ -256,9 +512,10 @@ class ReviewWindow(QDialog):
         self.layout().addWidget(button_box)
 
     def get_edited_subs(self):
-        """Return the subtitle object with edited text."""
-        for i in range(self.model.rowCount()):
-            self.translated_subs[i].text = self.model.item(i, 1).text()
+        """Return the subtitle object with edited text.
+
+        Edits are written to the subtitles by the model as they are made.
+        """
         return self.translated_subs
 
 class MainWindow(QMainWindow):
@@ -272,6 +529,29 @@ class MainWindow(QMainWindow):
         self.settings = QSettings()
         self.translator = None
 
+        # Settings edits are applied after a short pause (see on_settings_changed)
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(SETTINGS_DEBOUNCE_MS)
+        self._settings_timer.timeout.connect(self._apply_settings)
+
+        # Log messages waiting to be written to the log widget, as
+        # (timestamp, level, message) tuples
+        self._log_buffer: List[tuple] = []
+        self._log_formats = {level: _char_format(color) for level, color in LOG_COLORS.items()}
+        self._log_timestamp_format = _char_format(LOG_TIMESTAMP_COLOR)
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.timeout.connect(self._flush_log)
+
+        # Latest (current, total, status) progress report not yet shown
+        self._pending_progress: Optional[tuple] = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(PROGRESS_UPDATE_INTERVAL_MS)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
         # Set up logging
         self.log_handler = QtLogHandler()
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -280,21 +560,29 @@ class MainWindow(QMainWindow):
         logging.getLogger().addHandler(self.log_handler)
         logging.getLogger().setLevel(logging.INFO)
         self.translation_worker = None
-        self.translation_thread = None
+        self.translation_future = None
         self.current_files = []
         self._is_busy = False
         
-        # Animation for busy state
+        # Animation for busy state: the value steps through the ellipsis frames.
+        # valueChanged fires on every animation update, so the spinner text is
+        # only set when the frame index changes
+        self._busy_frames = ["", ".", "..", "..."]
+        self._busy_message = ""
+        self._busy_frame = 0
         self.busy_animation = QVariantAnimation(self)
         self.busy_animation.setStartValue(0)
-        self.busy_animation.setEndValue(100)
-        self.busy_animation.setDuration(1000)
+        self.busy_animation.setEndValue(len(self._busy_frames))
+        self.busy_animation.setDuration(2000)
         self.busy_animation.setLoopCount(-1)  # Infinite loop
         self.busy_animation.valueChanged.connect(self._update_busy_animation)
         
+        # Event loop shared by all translation jobs
+        self.async_loop = AsyncLoopThread(self)
+        self.async_loop.start()
+        
         self.init_ui()
         self.load_settings()
-        self.init_translator()
     
     def init_ui(self):
         """Initialize the user interface."""
@@ -335,27 +623,29 @@ class MainWindow(QMainWindow):
         file_group = QGroupBox("Files to Translate")
         file_layout = QVBoxLayout(file_group)
         
-        self.file_list = QListWidget()
+        self.file_model = SubtitleFileListModel(self)
+        self.file_list = QListView()
+        self.file_list.setModel(self.file_model)
         self.file_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.file_list.setDragDropMode(QAbstractItemView.DragDropMode.DropOnly)
         self.file_list.setAcceptDrops(True)
         self.file_list.setStyleSheet(
             """
-            QListWidget {
+            QListView {
                 border: 2px dashed #666;
                 border-radius: 5px;
                 padding: 10px;
                 background-color: rgba(100, 100, 100, 50);
             }
-            QListWidget::item {
+            QListView::item {
                 padding: 5px;
                 background-color: transparent;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: rgba(42, 130, 218, 100);
                 color: white;
             }
-            QListWidget::item:hover {
+            QListView::item:hover {
                 background-color: rgba(42, 130, 218, 50);
             }
             """
@@ -367,6 +657,7 @@ class MainWindow(QMainWindow):
         self.add_folder_btn.clicked.connect(self.add_folder)
         self.clear_files_btn = QPushButton("Clear All")
         self.clear_files_btn.clicked.connect(self.clear_files)
+        file_buttons = QHBoxLayout()
         file_buttons.addWidget(self.add_files_btn)
         file_buttons.addWidget(self.add_folder_btn)
         file_buttons.addStretch()
@@ -380,13 +671,12 @@ class MainWindow(QMainWindow):
         settings_layout = QFormLayout(settings_group)
         
         self.translator_combo = QComboBox()
-        # Add Local NLLB first as it's the default
-        self.translator_combo.addItem("Local NLLB Server", "local_nllb")
-        # Other translators
-        self.translator_combo.addItem("Hugging Face API", "huggingface")
-        self.translator_combo.addItem("Google Translate", "google")
-        self.translator_combo.addItem("DeepL", "deepl")
-        self.translator_combo.addItem("Gemini", "gemini")
+        # Local NLLB comes first as it's the default
+        for label, translator_type in TRANSLATOR_CHOICES:
+            self.translator_combo.addItem(label, translator_type)
+        self._translator_index = {
+            translator_type: index for index, (_label, translator_type) in enumerate(TRANSLATOR_CHOICES)
+        }
         # Set Local NLLB as default
         self.translator_combo.setCurrentIndex(0)
         self.translator_combo.currentIndexChanged.connect(self.on_translator_changed)
@@ -470,11 +760,11 @@ class MainWindow(QMainWindow):
         self.progress_bar.setTextVisible(True)
         self.progress_bar.setRange(0, 100)
         
-        self.log_edit = QTextEdit()
+        # Plain-text layout only lays out the visible lines of a long log
+        self.log_edit = QPlainTextEdit()
         self.log_edit.setReadOnly(True)
-        monospace_font = QFont('Menlo' if sys.platform == 'darwin' else 'Courier New')
-        monospace_font.setStyleHint(QFont.StyleHint.Monospace)
-        self.log_edit.setFont(monospace_font)
+        self.log_edit.setMaximumBlockCount(LOG_MAX_LINES)
+        self.log_edit.setFont(_monospace_font())
         
         progress_layout.addWidget(self.status_label)
         progress_layout.addWidget(self.progress_bar)
@@ -499,19 +789,6 @@ class MainWindow(QMainWindow):
         self.on_translator_changed()
 
     @pyqtSlot(str, str)
-    def log(self, message: str, level: str = 'info'):
-        """Log a message to the log widget."""
-        color_map = {
-            'debug': 'gray',
-            'info': 'white',
-            'warning': 'orange',
-            'error': 'red',
-            'critical': 'red',
-        }
-        color = color_map.get(level, 'white')
-        log_entry = f'<font color="{color}">{message}</font>'
-        self.log_edit.append(log_entry)
-    
     def create_toolbar(self):
         """Create the application toolbar."""
         toolbar = QToolBar("Main Toolbar")
@@ -567,47 +844,76 @@ class MainWindow(QMainWindow):
     def populate_language_combos(self):
         """Populate the language combo boxes."""
         languages = self.config.get_available_languages()
-        
-        self.source_lang_combo.clear()
-        self.target_lang_combo.clear()
-        
-        for code, name in languages.items():
-            self.source_lang_combo.addItem(f"{name} ({code})", code)
-            self.target_lang_combo.addItem(f"{name} ({code})", code)
+        codes = list(languages)
+        labels = [f"{name} ({code})" for code, name in languages.items()]
+        # Both combos hold the same items, so one code -> row index serves both
+        self._language_index = {code: index for index, code in enumerate(codes)}
+        
+        # Labels are built once and added in bulk; only the item data is set per row
+        for combo in (self.source_lang_combo, self.target_lang_combo):
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItems(labels)
+            for index, code in enumerate(codes):
+                combo.setItemData(index, code)
+            combo.blockSignals(False)
         
         source_lang = self.config.get('languages.source', 'eng_Latn')
         target_lang = self.config.get('languages.target', 'nld_Latn')
         
-        source_index = self.source_lang_combo.findData(source_lang)
-        if source_index >= 0:
+        source_index = self._language_index.get(source_lang)
+        if source_index is not None:
             self.source_lang_combo.setCurrentIndex(source_index)
         
-        target_index = self.target_lang_combo.findData(target_lang)
-        if target_index >= 0:
+        target_index = self._language_index.get(target_lang)
+        if target_index is not None:
             self.target_lang_combo.setCurrentIndex(target_index)
         
         self.source_lang_combo.currentIndexChanged.connect(self.on_settings_changed)
         self.target_lang_combo.currentIndexChanged.connect(self.on_settings_changed)
     
+    def _settings_widgets(self) -> tuple:
+        """Get the widgets whose change signals re-initialize the translator."""
+        return (
+            self.translator_combo, self.endpoint_edit, self.hf_api_key_edit,
+            self.deepl_api_key_edit, self.gemini_api_key_edit, self.gemini_prompt_edit,
+            self.gemini_tone_edit, self.batch_size_spin, self.timeout_spin,
+            self.source_lang_combo, self.target_lang_combo,
+        )
+    
     def load_settings(self):
-        """Load settings from config."""
-        # Always start with Local NLLB
-        index = self.translator_combo.findData('local_nllb')
-        if index >= 0:
-            self.translator_combo.setCurrentIndex(index)
-        
-        self.endpoint_edit.setText(self.config.get('translator.endpoint', 'http://localhost:8080/translate'))
-        self.hf_api_key_edit.setText(self.settings.value("huggingface/api_key", ""))
-        self.deepl_api_key_edit.setText(self.settings.value("deepl/api_key", ""))
-        self.gemini_api_key_edit.setText(self.settings.value("gemini/api_key", ""))
-        self.gemini_prompt_edit.setText(self.settings.value("gemini/prompt_template", ""))
-        self.gemini_tone_edit.setText(self.settings.value("gemini/tone", ""))
-        self.batch_size_spin.setValue(self.config.get('translator.batch_size', 5))
-        self.timeout_spin.setValue(self.config.get('translator.timeout', 300))
+        """Load settings from config.
+        
+        Change signals are blocked while the widgets are filled in, and the
+        translator is initialized once at the end instead of after every field.
+        """
+        widgets = self._settings_widgets()
+        for widget in widgets:
+            widget.blockSignals(True)
+        try:
+            # Always start with Local NLLB
+            self.translator_combo.setCurrentIndex(self._translator_index['local_nllb'])
+            
+            self.endpoint_edit.setText(self.config.get('translator.endpoint', 'http://localhost:8080/translate'))
+            self.hf_api_key_edit.setText(self.settings.value("huggingface/api_key", ""))
+            self.deepl_api_key_edit.setText(self.settings.value("deepl/api_key", ""))
+            self.gemini_api_key_edit.setText(self.settings.value("gemini/api_key", ""))
+            self.gemini_prompt_edit.setText(self.settings.value("gemini/prompt_template", ""))
+            self.gemini_tone_edit.setText(self.settings.value("gemini/tone", ""))
+            self.batch_size_spin.setValue(self.config.get('translator.batch_size', 5))
+            self.timeout_spin.setValue(self.config.get('translator.timeout', 300))
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
+        
+        # Apply the translator type's visible settings and create the translator
+        self.on_translator_changed()
         
         output_dir = self.config.get('directories.save_location', str(Path.home() / 'Documents' / 'Translated Subtitles'))
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
         self.output_dir_edit.setText(output_dir)
+        # Create the directory in the background so a slow (e.g. network) home
+        # directory does not hold up the window
+        QThreadPool.globalInstance().start(lambda: _ensure_directory(output_dir))
         
         geometry = self.config.get('ui.window_geometry')
         if geometry:
@@ -645,9 +951,15 @@ class MainWindow(QMainWindow):
         self.setEnabled(not busy)
         
         if busy:
+            self._busy_message = message
             self.overlay.raise_()
             self.overlay.show()
+            # Size the spinner for the longest frame so it does not move while animating
+            self.spinner.setText(message + self._busy_frames[-1])
+            self.spinner.adjustSize()
             self.spinner.setText(message)
+            self._busy_frame = 0
+            self._position_busy_overlay()
             self.spinner.show()
             self.busy_animation.start()
             QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
@@ -662,44 +974,57 @@ class MainWindow(QMainWindow):
         if not self._is_busy:
             return
             
-        # Update spinner text with ellipsis animation
-        text = self.spinner.text().strip('.')
-        dots = '.' * ((value // 20) % 4)
-        self.spinner.setText(f"{text}{dots}")
-        
-        # Update overlay size if window was resized
+        # Update spinner text with ellipsis animation when the frame changes
+        frame = value % len(self._busy_frames)
+        if frame == self._busy_frame:
+            return
+        self._busy_frame = frame
+        self.spinner.setText(f"{self._busy_message}{self._busy_frames[frame]}")
+    
+    def _position_busy_overlay(self):
+        """Stretch the busy overlay over the window and center the spinner."""
         self.overlay.setGeometry(0, 0, self.width(), self.height())
         self.spinner.move(
             (self.width() - self.spinner.width()) // 2,
             (self.height() - self.spinner.height()) // 2
         )
     
+    def _translation_config(self) -> TranslationConfig:
+        """Build a translation configuration from the current settings widgets."""
+        translator_type = self.translator_combo.currentData()
+        api_key = ""
+        if translator_type == 'huggingface':
+            api_key = self.hf_api_key_edit.text()
+        elif translator_type == 'deepl':
+            api_key = self.deepl_api_key_edit.text()
+        elif translator_type == 'gemini':
+            api_key = self.gemini_api_key_edit.text()
+        elif translator_type == 'google':
+            api_key = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS', '')
+
+        return TranslationConfig(
+            translator_type=translator_type,
+            endpoint=self.endpoint_edit.text(),
+            api_key=api_key,
+            gemini_prompt_template=self.gemini_prompt_edit.toPlainText(),
+            gemini_tone=self.gemini_tone_edit.text(),
+            batch_size=self.batch_size_spin.value(),
+            source_language=self.source_lang_combo.currentData(),
+            target_language=self.target_lang_combo.currentData(),
+            timeout=self.timeout_spin.value()
+        )
+    
     def init_translator(self):
         """Initialize the translator with current settings."""
+        # A full re-initialization supersedes any pending settings update
+        self._settings_timer.stop()
         try:
-            translator_type = self.translator_combo.currentData()
-            api_key = ""
-            if translator_type == 'huggingface':
-                api_key = self.hf_api_key_edit.text()
-            elif translator_type == 'deepl':
-                api_key = self.deepl_api_key_edit.text()
-            elif translator_type == 'gemini':
-                api_key = self.gemini_api_key_edit.text()
-            elif translator_type == 'google':
-                api_key = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS', '')
-
-            config = TranslationConfig(
-                translator_type=translator_type,
-                endpoint=self.endpoint_edit.text(),
-                api_key=api_key,
-                gemini_prompt_template=self.gemini_prompt_edit.toPlainText(),
-                gemini_tone=self.gemini_tone_edit.text(),
-                batch_size=self.batch_size_spin.value(),
-                source_language=self.source_lang_combo.currentData(),
-                target_language=self.target_lang_combo.currentData(),
-                timeout=self.timeout_spin.value()
-            )
+            config = self._translation_config()
+            old_translator = self.translator
             self.translator = Translator(config)
+            if old_translator is not None:
+                # Release the old translator's HTTP session on the loop that owns it
+                self.async_loop.submit(old_translator.close())
         except Exception as e:
             self.log(f"Failed to initialize translator: {e}", 'error')
             QMessageBox.critical(self, "Translator Error", f"Failed to initialize translator: {str(e)}")
@@ -719,8 +1044,33 @@ class MainWindow(QMainWindow):
         self.init_translator()
     
     def on_settings_changed(self):
-        """Handle settings changes."""
-        self.init_translator()
+        """Handle settings changes.
+        
+        Changes are applied once the settings have been left alone for
+        SETTINGS_DEBOUNCE_MS, so typing an API key or prompt does not update
+        the translator on every keystroke.
+        """
+        self._settings_timer.start()
+    
+    def _apply_settings(self):
+        """Apply the current settings to the existing translator."""
+        self._settings_timer.stop()
+        if self.translator is None:
+            self.init_translator()
+            return
+        
+        translator = self.translator
+        settings = dataclasses.asdict(self._translation_config())
+        
+        async def _update():
+            # Runs on the loop that owns the backend's session, so a backend that
+            # has to be rebuilt is closed there too
+            try:
+                translator.update_config(**settings)
+            except Exception as e:
+                logger.error(f"Failed to apply translator settings: {e}")
+        
+        self.async_loop.submit(_update())
     
     def add_files(self):
         """Add files to the translation list."""
@@ -732,44 +1082,24 @@ class MainWindow(QMainWindow):
         """Add all subtitle files from a folder."""
         folder = QFileDialog.getExistingDirectory(self, "Select Folder")
         if folder:
-            files = []
-            for ext in ('*.srt', '*.ass', '*.ssa', '*.vtt'):
-                files.extend(Path(folder).rglob(ext))
-            self.add_file_paths([str(f) for f in files])
+            self.add_file_paths(list(_iter_subtitle_files(folder)))
     
     def add_file_paths(self, file_paths: List[str]):
         """Add multiple file paths to the list."""
-        # Supported subtitle file extensions
-        supported_extensions = {'.srt', '.ass', '.ssa', '.vtt'}
-        
-        current_files = {self.file_list.item(i).data(Qt.ItemDataRole.UserRole) for i in range(self.file_list.count())}
-        added_count = 0
-        
-        for file_path in file_paths:
-            path = Path(file_path)
-            
-            # Check if it's a supported subtitle file
-            if path.suffix.lower() not in supported_extensions:
-                continue
-                
-            # Skip if already in the list
-            if file_path in current_files:
-                continue
-                
-            item = QListWidgetItem(path.name)
-            item.setData(Qt.ItemDataRole.UserRole, file_path)
-            item.setToolTip(file_path)
-            self.file_list.addItem(item)
-            added_count += 1
+        # Only supported subtitle files; the model skips files already in the list
+        added_count = self.file_model.add_paths([
+            file_path for file_path in file_paths
+            if os.path.splitext(file_path)[1].lower() in SUBTITLE_EXTENSIONS
+        ])
             
         if added_count > 0:
             self.statusBar().showMessage(f"Added {added_count} file(s).", 3000)
     
     def clear_files(self):
         """Clear the file list."""
-        if self.file_list.count() > 0:
+        if self.file_model.rowCount() > 0:
             if QMessageBox.question(self, "Clear Files", "Are you sure?") == QMessageBox.StandardButton.Yes:
-                self.file_list.clear()
+                self.file_model.clear()
     
     def browse_output_dir(self):
         """Browse for output directory."""
@@ -782,7 +1112,7 @@ class MainWindow(QMainWindow):
         if self._is_busy:
             return
             
-        if self.file_list.count() == 0:
+        if self.file_model.rowCount() == 0:
             QMessageBox.warning(self, "No Files", "Please add files to translate.")
             return
         
@@ -799,31 +1129,27 @@ class MainWindow(QMainWindow):
         
         self.save_settings()
         
-        files = [Path(self.file_list.item(i).data(Qt.ItemDataRole.UserRole)) for i in range(self.file_list.count())]
+        # Make sure the job uses settings that were edited just before starting
+        if self._settings_timer.isActive():
+            self._apply_settings()
+        
+        files = [Path(file_path) for file_path in self.file_model.paths()]
         
         # Clear previous state
         self.progress_bar.setValue(0)
         self.log_edit.clear()
+        self._log_buffer.clear()
         
-        # Set up worker and thread
+        # Set up the worker; its signals are emitted from the loop thread and
+        # delivered to the slots below on the GUI thread
         self.translation_worker = TranslationWorker(self.translator, files, output_dir)
-        self.translation_thread = QThread()
-        self.translation_worker.moveToThread(self.translation_thread)
         
         # Connect signals
         self.translation_worker.progress_updated.connect(self.on_translation_progress)
         self.translation_worker.translation_complete.connect(self.on_translation_complete)
         self.translation_worker.review_ready.connect(self.show_review_window)
         self.translation_worker.error_occurred.connect(self.on_translation_error)
-        
-        # Create a runner for the async task
-        self.async_runner = AsyncRunner(self.translation_worker.run_translation)
-        self.async_runner.moveToThread(self.translation_thread)
-
-        # Connect thread events
-        self.translation_thread.started.connect(self.async_runner.run)
-        self.async_runner.finished.connect(self.cleanup_translation)
-        self.translation_thread.finished.connect(self.translation_thread.deleteLater)
+        self.translation_worker.finished.connect(self.cleanup_translation)
         
         # Set up cancellation
         self.cancel_requested = False
@@ -834,12 +1160,27 @@ class MainWindow(QMainWindow):
         # Show busy state
         self.set_busy(True, "Working on translation...")
         
-        # Start the thread
-        self.translation_thread.start()
+        # Start the translation on the shared event loop
+        self.translation_future = self.async_loop.submit(self.translation_worker.run_translation())
     
 
     def on_translation_progress(self, current: int, total: int, status: str):
-        """Handle translation progress."""
+        """Handle translation progress.
+        
+        Only the latest report is kept; _flush_progress shows it, so a burst
+        of reports costs a single repaint.
+        """
+        self._pending_progress = (current, total, status)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+    
+    def _flush_progress(self):
+        """Show the latest progress report on the progress bar and status label."""
+        self._progress_timer.stop()
+        if self._pending_progress is None:
+            return
+        current, total, status = self._pending_progress
+        self._pending_progress = None
         try:
             self.progress_bar.setMaximum(total)
             self.progress_bar.setValue(current)
@@ -851,9 +1192,6 @@ class MainWindow(QMainWindow):
             
             self.status_label.setText(status)
             
-            # Process events to keep UI responsive
-            QApplication.processEvents()
-            
         except Exception as e:
             self.log(f"Error updating progress: {e}", 'error')
     
@@ -870,6 +1208,9 @@ class MainWindow(QMainWindow):
             self.cancel_requested = True
             if self.translation_worker:
                 self.translation_worker.stop()
+            if self.translation_future:
+                # Cancels the running task; the loop and its connections stay up
+                self.translation_future.cancel()
             self.cleanup_translation()
             self.log("Translation cancelled by user.", 'warning')
             self.status_label.setText("Translation cancelled")
@@ -881,18 +1222,19 @@ class MainWindow(QMainWindow):
         self.translate_btn.clicked.disconnect()
         self.translate_btn.clicked.connect(self.start_translation)
         
-        # Clean up thread and worker
-        if self.translation_thread:
-            if self.translation_thread.isRunning():
-                self.translation_thread.quit()
-                self.translation_thread.wait(2000)  # Wait up to 2 seconds
-            self.translation_thread = None
+        # Drop progress reports that arrived after the job ended
+        self._progress_timer.stop()
+        self._pending_progress = None
         
+        # Clean up worker
+        self.translation_future = None
         self.translation_worker = None
         self.set_busy(False)
     
     def on_translation_complete(self, success: bool, message: str):
         """Handle translation completion."""
+        # Show the last progress report first, so it cannot overwrite the result
+        self._flush_progress()
         try:
             self.status_label.setText("Ready" if success else "Translation completed with errors")
             
@@ -934,18 +1276,36 @@ class MainWindow(QMainWindow):
 
     @pyqtSlot(str, str)
     def log(self, message: str, level: str = 'info'):
-        """Add a message to the log."""
-        color = {
-            'info': '#FFFFFF',
-            'warning': '#FFA500',
-            'error': '#FF4500'
-        }.get(level, '#FFFFFF')
-        
+        """Add a message to the log.
+
+        Messages are buffered and written to the widget by _flush_log, so a
+        burst of log records causes a single re-layout.
+        """
         timestamp = QDateTime.currentDateTime().toString("hh:mm:ss")
-        
-        cursor = self.log_edit.textCursor()
+        self._log_buffer.append((timestamp, level, message))
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        """Write all buffered log messages to the log widget at once.
+
+        Messages are inserted as plain text, one line each, so markup in them
+        (e.g. subtitle ``<i>`` tags) is shown as-is rather than parsed.
+        """
+        if not self._log_buffer:
+            return
+        default_format = self._log_formats['info']
+        document = self.log_edit.document()
+        cursor = QTextCursor(document)
         cursor.movePosition(QTextCursor.MoveOperation.End)
-        cursor.insertHtml(f'<span style="color: #888;">[{timestamp}]</span> <span style="color: {color};">{message}</span><br>')
+        cursor.beginEditBlock()
+        for timestamp, level, message in self._log_buffer:
+            if not document.isEmpty():
+                cursor.insertBlock()
+            cursor.insertText(f"[{timestamp}] ", self._log_timestamp_format)
+            cursor.insertText(message, self._log_formats.get(level, default_format))
+        cursor.endEditBlock()
+        self._log_buffer.clear()
         self.log_edit.ensureCursorVisible()
 
     def show_preferences(self):
@@ -958,28 +1318,34 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Handle window close event."""
-        if self.translation_thread and self.translation_thread.isRunning():
+        if self.translation_future and not self.translation_future.done():
             if QMessageBox.question(self, "Confirm Exit", "Translation in progress. Quit?") == QMessageBox.StandardButton.No:
                 event.ignore()
                 return
             self.translation_worker.stop()
-            self.translation_thread.quit()
-            self.translation_thread.wait()
+            self.translation_future.cancel()
         
         self.save_settings()
+        
+        # Close the translator's connections, then shut the event loop down
+        if self.translator is not None:
+            try:
+                self.async_loop.submit(self.translator.close()).result(timeout=5)
+            except Exception as e:
+                logger.warning(f"Failed to close translator: {e}")
+        self.async_loop.stop()
         event.accept()
     
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter event."""
         if event.mimeData().hasUrls():
             # Check if any of the URLs are local files with supported extensions
-            supported_extensions = {'.srt', '.ass', '.ssa', '.vtt'}
             has_supported_files = False
             
             for url in event.mimeData().urls():
                 if url.isLocalFile():
                     file_path = url.toLocalFile()
-                    if Path(file_path).suffix.lower() in supported_extensions:
+                    if Path(file_path).suffix.lower() in SUBTITLE_EXTENSIONS:
                         has_supported_files = True
                         break
             
@@ -1002,15 +1368,14 @@ class MainWindow(QMainWindow):
         super().resizeEvent(event)
         # Update overlay and spinner positions when window is resized
         if hasattr(self, 'overlay') and hasattr(self, 'spinner'):
-            self.overlay.setGeometry(0, 0, self.width(), self.height())
-            self.spinner.move(
-                (self.width() - self.spinner.width()) // 2,
-                (self.height() - self.spinner.height()) // 2
-            )
+            self._position_busy_overlay()
 
 
 def main():
     """Main entry point for the GUI application."""
+    # Large subtitle files are parsed in worker processes; needed when frozen
+    multiprocessing.freeze_support()
+    
     # Set high DPI settings before creating the application
     if hasattr(Qt, 'HighDpiScaleFactorRoundingPolicy'):
         QGuiApplication.setHighDpiScaleFactorRoundingPolicy(
@@ -1033,6 +1398,8 @@ def main():
         ]
     )
     
+    ensure_directories()
+    
     # Create application
     app = QApplication(sys.argv)
     
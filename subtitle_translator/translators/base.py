@@ -1,18 +1,243 @@
 """Base translator interface for the subtitle translator."""
 
 import asyncio
+import atexit
+import copy
+import functools
+import gzip
+import json
+import os
+import random
+import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, List, Tuple
+from typing import Dict, Any, Callable, Optional, Union, List, Tuple
 import logging
 import pysubs2
 import warnings
 
+from ..utils.translation_cache import TranslationCache
+
+try:
+    import orjson
+except ImportError:  # optional, installed by the ``fast`` extra
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Seconds that HTTP-based translators reuse a resolved host name; sessions are
+# kept for the lifetime of the translator, so lookups need not repeat every 10s
+HTTP_DNS_CACHE_TTL = 300
+
+# Connection pool of HTTP-based translators: concurrent batches reuse up to 32
+# kept-alive connections per host instead of reconnecting (and redoing TLS)
+HTTP_CONNECTOR_OPTIONS = {
+    'limit': 64,
+    'limit_per_host': 32,
+    'keepalive_timeout': 75,
+    'ttl_dns_cache': HTTP_DNS_CACHE_TTL,
+}
+
+# HTTP sessions shared by translators with the same settings on the same event
+# loop: (loop, key) -> [session, number of translators holding it]
+_SHARED_SESSIONS: Dict[tuple, list] = {}
+
+# Attempts per HTTP request that is rate limited (429) or fails on the server (5xx),
+# and the longest wait between attempts when the server gives no Retry-After
+HTTP_MAX_ATTEMPTS = 5
+HTTP_MAX_BACKOFF = 30
+
+# Smallest request body worth compressing when request compression is enabled
+GZIP_MIN_BYTES = 1024
+
+# Subtitle text with nothing to translate: blank, numbers, timestamps, punctuation or music notes
+_UNTRANSLATABLE_RE = re.compile(r'[\d\s:.,;!?\'"()\[\]\-\u2013\u2014\u2026\u266a\u266b]*')
+
+# Most translations a translator keeps in memory; the least recently used go first
+TM_CACHE_SIZE = 100000
+
+# Subtitle files at least this large are parsed in a worker process, so parsing
+# them does not hold the GIL while other translations run on the event loop
+PROCESS_PARSE_MIN_BYTES = 1024 * 1024
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize a request body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+def _json_loads(data: bytes) -> Any:
+    """Parse a response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _acquire_session(key: tuple, create: Callable[[], Any]) -> Tuple[Any, tuple]:
+    """Get the HTTP session shared under ``key`` on the running loop.
+
+    The session is created with ``create`` if no translator holds one yet.
+
+    Returns:
+        The session, and the handle to pass to _release_session
+    """
+    handle = (asyncio.get_running_loop(), key)
+    entry = _SHARED_SESSIONS.get(handle)
+    if entry is None:
+        entry = _SHARED_SESSIONS[handle] = [create(), 0]
+    entry[1] += 1
+    return entry[0], handle
+
+async def _release_session(handle: tuple, session: Any) -> None:
+    """Release a session from _acquire_session, closing it when no translator holds it."""
+    entry = _SHARED_SESSIONS.get(handle)
+    if entry is None or entry[0] is not session:
+        return
+    entry[1] -= 1
+    if entry[1] <= 0:
+        del _SHARED_SESSIONS[handle]
+        await session.close()
+
+async def _post_json(session: Any, url: str, payload: Any, compress: bool = False) -> Any:
+    """POST a JSON payload and return the parsed JSON response.
+
+    With ``compress``, bodies of at least GZIP_MIN_BYTES are sent gzip-compressed
+    (Content-Encoding: gzip); only use it with servers that accept that.
+
+    Rate limiting (429) and server errors (5xx) are retried up to
+    HTTP_MAX_ATTEMPTS times, waiting for the server's Retry-After seconds
+    when given and backing off exponentially otherwise, with jitter.
+
+    Raises:
+        Exception: If the request fails with another status, or keeps failing
+    """
+    request = {'json': payload}
+    if compress:
+        body = _json_dumps(payload).encode('utf-8')
+        if len(body) >= GZIP_MIN_BYTES:
+            request = {
+                'data': gzip.compress(body, compresslevel=1),
+                'headers': {'Content-Encoding': 'gzip', 'Content-Type': 'application/json'}
+            }
+    for attempt in range(HTTP_MAX_ATTEMPTS):
+        async with session.post(url, **request) as response:
+            if response.status == 200:
+                return _json_loads(await response.read())
+            error_text = await response.text()
+            retry_after = response.headers.get('Retry-After', '')
+        if (response.status != 429 and response.status < 500) or attempt == HTTP_MAX_ATTEMPTS - 1:
+            raise Exception(f"Translation request failed with status {response.status}: {error_text}")
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            delay = min(2 ** attempt, HTTP_MAX_BACKOFF)
+        delay += random.uniform(0, 0.25)
+        logger.warning(f"Translation request failed with status {response.status}; retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+def _read_subtitles(input_path: Path) -> str:
+    """Read the text of a subtitle file.
+
+    Decoding is strict UTF-8, as when cached translations are loaded, so
+    files in another encoding fail clearly instead of losing characters.
+    """
+    try:
+        return input_path.read_text(encoding="utf-8")
+    except UnicodeDecodeError as e:
+        raise ValueError(f"{input_path.name} is not UTF-8 encoded ({e}); convert it to UTF-8 first") from None
+
+def _parse_subtitles(data: str) -> pysubs2.SSAFile:
+    """Parse subtitle text; module-level so that worker processes can run it."""
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=RuntimeWarning)
+        return pysubs2.SSAFile.from_string(data)
+
+def _copy_subtitles(subs: pysubs2.SSAFile) -> pysubs2.SSAFile:
+    """Copy a parsed subtitle file for translation; only events are modified."""
+    translated_subs = copy.copy(subs)
+    translated_subs.events = [event.copy() for event in subs.events]
+    translated_subs.styles = subs.styles.copy()
+    translated_subs.info = subs.info.copy()
+    return translated_subs
+
+def _load_subtitles(input_path: Path) -> Tuple[pysubs2.SSAFile, pysubs2.SSAFile]:
+    """Load a subtitle file: the original and a copy to translate."""
+    original_subs = _parse_subtitles(_read_subtitles(input_path))
+    return original_subs, _copy_subtitles(original_subs)
+
+def _dedupe(texts: List[str]) -> Tuple[List[str], List[int]]:
+    """Get the distinct texts in order, and each text's index among them.
+
+    Backends translate the distinct texts and fan the results back out with
+    ``[translated[i] for i in indices]``.
+    """
+    positions: Dict[str, int] = {}
+    indices = [positions.setdefault(text, len(positions)) for text in texts]
+    return list(positions), indices
+
+def _fit_translations(translations: List[str], count: int) -> List[str]:
+    """Match the translations a server returned to the ``count`` texts sent.
+
+    Missing translations are left empty, so those lines keep their source
+    text, and extra ones are dropped.
+    """
+    if len(translations) != count:
+        logger.warning(f"Expected {count} translations from the server, got {len(translations)}")
+        translations = (list(translations) + [''] * count)[:count]
+    return translations
+
+def _pack_texts(texts: List[str], max_texts: int, max_chars: int) -> List[List[str]]:
+    """Split texts into request-sized chunks of at most ``max_texts`` texts and ``max_chars`` characters.
+
+    A text longer than ``max_chars`` is sent in a chunk of its own.
+    """
+    chunks = []
+    chunk = []
+    chunk_chars = 0
+    for text in texts:
+        if chunk and (len(chunk) == max_texts or chunk_chars + len(text) > max_chars):
+            chunks.append(chunk)
+            chunk = []
+            chunk_chars = 0
+        chunk.append(text)
+        chunk_chars += len(text)
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+@functools.lru_cache(maxsize=None)
+def _open_line_cache(path: Optional[str], ttl: Optional[float]) -> Optional[TranslationCache]:
+    """Get the shared line cache for a database path, or None if it cannot be opened."""
+    try:
+        return TranslationCache(path, ttl)
+    except Exception as e:
+        logger.warning(f"Translation cache unavailable: {e}")
+        return None
+
+@functools.lru_cache(maxsize=None)
+def _parse_pool() -> ProcessPoolExecutor:
+    """Get the process pool used to parse large subtitle files.
+
+    The pool is shut down when the interpreter exits.
+    """
+    pool = ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+    atexit.register(pool.shutdown)
+    return pool
+
 class BaseTranslator(ABC):
     """Abstract base class for all translator implementations."""
 
+    # Configuration keys that rebind() can change on a live instance
+    _REBINDABLE_KEYS = frozenset({'batch_size', 'source_language', 'target_language'})
+
+    # Configuration keys that do not affect the translations a backend returns
+    _CACHE_NEUTRAL_KEYS = frozenset({
+        'api_key', 'batch_size', 'timeout', 'concurrency', 'source_language',
+        'target_language', 'use_cache', 'cache_path', 'cache_ttl', 'compress_requests',
+        'project_id', 'location'
+    })
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize the translator with the given configuration.
 
@@ -21,6 +246,57 @@ class BaseTranslator(ABC):
         """
         self.config = config or {}
         self.batch_size = int(self.config.get('batch_size', 5))
+        # Recent translations made by this instance, least recently used first:
+        # (source, target, text) -> translation
+        self._tm_cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+        # Texts being translated right now, with a future that is done when they are
+        self._inflight: Dict[Tuple[str, str, str], asyncio.Future] = {}
+
+    def rebind(self, config: Dict[str, Any]) -> bool:
+        """Apply a new configuration to this instance without rebuilding it.
+
+        Args:
+            config: The complete new configuration dictionary
+
+        Returns:
+            True if the configuration was applied, False if it changes settings
+            that require a new translator instance
+        """
+        changed = {
+            key for key in self.config.keys() | config.keys()
+            if self.config.get(key) != config.get(key)
+        }
+        if not changed <= self._REBINDABLE_KEYS:
+            return False
+        if not changed <= self._CACHE_NEUTRAL_KEYS:
+            # The remembered translations came from the previous settings
+            self._tm_cache.clear()
+        self.config = dict(config)
+        self.batch_size = int(self.config.get('batch_size', 5))
+        return True
+
+    def _remember(self, key: Tuple[str, str, str], translation: str) -> None:
+        """Store a translation in memory, evicting the least recently used beyond TM_CACHE_SIZE."""
+        memory = self._tm_cache
+        memory[key] = translation
+        memory.move_to_end(key)
+        if len(memory) > TM_CACHE_SIZE:
+            memory.popitem(last=False)
+
+    def _line_cache(self) -> Optional[TranslationCache]:
+        """Get the persistent line cache, or None if caching is disabled."""
+        if not self.config.get('use_cache', True):
+            return None
+        ttl = self.config.get('cache_ttl')
+        return _open_line_cache(self.config.get('cache_path'), float(ttl) if ttl else None)
+
+    def _cache_namespace(self) -> str:
+        """Identify this backend and the settings that shape its translations."""
+        settings = {
+            key: value for key, value in self.config.items()
+            if key not in self._CACHE_NEUTRAL_KEYS
+        }
+        return f"{type(self).__name__}|{json.dumps(settings, sort_keys=True, default=str)}"
 
     @abstractmethod
     async def translate_text(
@@ -51,41 +327,173 @@ class BaseTranslator(ABC):
         **kwargs
     ) -> Optional[Tuple[pysubs2.SSAFile, pysubs2.SSAFile]]:
         """Translate a subtitle file and return original and translated subs objects."""
-        input_path = Path(input_file)
+        result = await self.translate_file_with_status(input_file, source_language, target_language, **kwargs)
+        if result is None:
+            return None
+        original_subs, translated_subs, _ = result
+        return original_subs, translated_subs
+
+    async def translate_file_with_status(
+        self,
+        input_file: Union[str, Path],
+        source_language: str,
+        target_language: str,
+        **kwargs
+    ) -> Optional[Tuple[pysubs2.SSAFile, pysubs2.SSAFile, bool]]:
+        """Translate a subtitle file, reporting whether every line was translated.
+
+        Returns:
+            The original and translated subs objects, and False if any
+            translatable line got no translation and kept its source text;
+            None if the file could not be translated at all
+        """
+        input_path = input_file if isinstance(input_file, Path) else Path(input_file)
 
         try:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", category=RuntimeWarning)
-                original_subs = pysubs2.load(str(input_path), encoding="utf-8")
-                translated_subs = pysubs2.load(str(input_path), encoding="utf-8") # Create a copy for translation
+            # Parse in an executor so other translations keep running; large
+            # files go to a worker process, as parsing them would hold the GIL
+            loop = asyncio.get_running_loop()
+            if input_path.stat().st_size < PROCESS_PARSE_MIN_BYTES:
+                original_subs, translated_subs = await loop.run_in_executor(None, _load_subtitles, input_path)
+            else:
+                data = await loop.run_in_executor(None, _read_subtitles, input_path)
+                original_subs = await loop.run_in_executor(_parse_pool(), _parse_subtitles, data)
+                translated_subs = await loop.run_in_executor(None, _copy_subtitles, original_subs)
         except Exception as e:
-            logger.error(f"Failed to read or parse subtitle file {input_path}: {e}")
+            logger.error("Failed to read or parse subtitle file %s: %s", input_path, e,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
         text_blocks = [event.plaintext for event in original_subs]
 
         if not text_blocks:
             logger.warning(f"No translatable text found in {input_path}")
-            return original_subs, translated_subs
+            return original_subs, translated_subs, True
+
+        # Repeated lines are translated once, lines already translated by this
+        # instance are not sent again, and lines without words are not sent at all
+        memory = self._tm_cache
+        untranslatable = _UNTRANSLATABLE_RE.fullmatch
+        unique_texts = [
+            text for text in dict.fromkeys(text_blocks)
+            if not untranslatable(text) and (source_language, target_language, text) not in memory
+        ]
+
+        # Lines that another file is translating right now are awaited instead
+        # of being sent again; the rest are registered as in flight until done
+        inflight = self._inflight
+        awaited = {}
+        own = {}
+        for text in unique_texts:
+            key = (source_language, target_language, text)
+            future = inflight.get(key)
+            if future is None:
+                own[key] = inflight[key] = loop.create_future()
+            else:
+                awaited[key] = future
+        unique_texts = [text for _, _, text in own]
 
         try:
-            translated_blocks = await self._translate_batch(
-                text_blocks,
-                source_language=source_language,
-                target_language=target_language,
-                batch_size=self.batch_size
-            )
+            error = None
+            try:
+                await self._translate_unique(unique_texts, source_language, target_language)
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                # Waiting files share the outcome: a failure is raised in them too
+                for key, future in own.items():
+                    del inflight[key]
+                    if error is None:
+                        future.set_result(None)
+                    elif isinstance(error, Exception):
+                        future.set_exception(error)
+                        future.exception()  # Reported here; waiters re-raise it themselves
+                    else:
+                        future.cancel()
+            if awaited:
+                await asyncio.wait(awaited.values())
+                # Lines whose translating file was cancelled are translated here instead
+                retry = []
+                for (_, _, text), future in awaited.items():
+                    if future.cancelled():
+                        retry.append(text)
+                    elif future.exception() is not None:
+                        raise future.exception()
+                await self._translate_unique(retry, source_language, target_language)
 
-            for i, event in enumerate(translated_subs):
-                if i < len(translated_blocks):
-                    event.plaintext = translated_blocks[i]
+            # The plaintext setter rewrites the event text, so skip lines that stay the same
+            untranslated = 0
+            for event, text in zip(translated_subs.events, text_blocks):
+                key = (source_language, target_language, text)
+                translation = memory.get(key)
+                if translation is None:
+                    if not untranslatable(text):
+                        untranslated += 1
+                    continue
+                memory.move_to_end(key)
+                if translation != text:
+                    event.plaintext = translation
 
-            return original_subs, translated_subs
+            if untranslated:
+                logger.warning("%d of %d lines in %s were not translated", untranslated, len(text_blocks), input_path)
+            return original_subs, translated_subs, not untranslated
 
         except Exception as e:
-            logger.error(f"Translation failed for {input_path}: {e}", exc_info=True)
+            # Tracebacks only at debug level, so a flapping endpoint does not flood the log
+            logger.error("Translation failed for %s: %s", input_path, e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
+    async def _translate_unique(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str
+    ) -> None:
+        """Translate distinct texts into the instance's translation memory.
+
+        Texts translated in earlier runs are taken from the persistent line
+        cache; only the rest are sent to the backend.
+        """
+        if not texts:
+            return
+        loop = asyncio.get_running_loop()
+
+        line_cache = self._line_cache()
+        if line_cache is not None:
+            namespace = self._cache_namespace()
+            keys = {
+                text: line_cache.key(namespace, source_language, target_language, text)
+                for text in texts
+            }
+            cached = await loop.run_in_executor(None, line_cache.get_many, list(keys.values()))
+            if cached:
+                remaining = []
+                for text in texts:
+                    translation = cached.get(keys[text])
+                    if translation is None:
+                        remaining.append(text)
+                    else:
+                        self._remember((source_language, target_language, text), translation)
+                texts = remaining
+                if not texts:
+                    return
+
+        translated_texts = await self._translate_batch(
+            texts,
+            source_language=source_language,
+            target_language=target_language,
+            batch_size=self.batch_size
+        )
+        new_entries = {}
+        for text, translation in zip(texts, translated_texts):
+            if translation:
+                self._remember((source_language, target_language, text), translation)
+                if line_cache is not None:
+                    new_entries[keys[text]] = translation
+        if new_entries:
+            await loop.run_in_executor(None, line_cache.put_many, new_entries)
+
     @abstractmethod
     async def _translate_batch(
         self,
@@ -101,19 +509,8 @@ class BaseTranslator(ABC):
         """Close any resources used by the translator."""
         pass
 
-    def __del__(self):
-        """Ensure resources are cleaned up when the object is destroyed."""
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If there's a running event loop, create a task to close the translator
-                loop.create_task(self.close())
-            else:
-                # If no running event loop, run the coroutine in a new event loop
-                loop.run_until_complete(self.close())
-        except Exception as e:
-            # Log any errors during cleanup but don't raise
-            logger.warning(f"Error during translator cleanup: {e}")
-        except:
-            # Ensure we don't raise exceptions during cleanup
-            pass
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -3,13 +3,34 @@
 import asyncio
 import logging
 from typing import Dict, Any, List, Optional
+import aiohttp
 
-import deepl
-
-from .base import BaseTranslator
+from ..utils.languages import NLLB_TO_ISO
+from .base import (
+    BaseTranslator, HTTP_CONNECTOR_OPTIONS, _acquire_session, _dedupe, _fit_translations,
+    _json_dumps, _pack_texts, _post_json, _release_session
+)
 
 logger = logging.getLogger(__name__)
 
+# Translation endpoints; keys for the free API end in ":fx"
+DEEPL_API_URL = "https://api.deepl.com/v2/translate"
+DEEPL_FREE_API_URL = "https://api-free.deepl.com/v2/translate"
+
+# Most texts the DeepL API accepts in a single request, and the most
+# characters sent in one, which keeps requests under its 128 KiB body limit
+DEEPL_MAX_TEXTS = 50
+DEEPL_MAX_CHARS = 30000
+
+def _deepl_language(code: str) -> str:
+    """Get the DeepL language code for an NLLB code such as 'spa_Latn' ('ES').
+
+    Regions are dropped ('zh-tw' -> 'ZH'); unknown codes fall back to the
+    part before the script.
+    """
+    iso = NLLB_TO_ISO.get(code) or code.split('_', 1)[0]
+    return iso.split('-', 1)[0].upper()
+
 class DeepLTranslator(BaseTranslator):
     """Translator using the DeepL API."""
 
@@ -17,51 +38,84 @@ class DeepLTranslator(BaseTranslator):
         """Initialize the DeepL translator."""
         super().__init__(config)
         self.api_key = self.config.get('api_key')
-        self.translator = None
-        if self.api_key:
-            self.translator = deepl.Translator(self.api_key)
+        self.api_url = DEEPL_FREE_API_URL if self.api_key and self.api_key.endswith(':fx') else DEEPL_API_URL
+        self.timeout = aiohttp.ClientTimeout(total=float(self.config.get('timeout', 300)))
+        # Most requests in flight at once
+        self.concurrency = int(self.config.get('concurrency') or 4)
+        self.session = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the aiohttp session shared by translators with the same API key and timeout."""
+        if self.session is None:
+            self.session, self._session_handle = _acquire_session(
+                ('deepl', self.api_key, self.timeout.total),
+                lambda: aiohttp.ClientSession(
+                    timeout=self.timeout,
+                    connector=aiohttp.TCPConnector(**HTTP_CONNECTOR_OPTIONS),
+                    json_serialize=_json_dumps,
+                    headers={'Authorization': f"DeepL-Auth-Key {self.api_key}"}
+                )
+            )
+        return self.session
 
     async def translate_text(
         self, text: str, source_language: str, target_language: str, **kwargs
     ) -> str:
         """Translate a single text string using DeepL."""
-        if not self.translator:
-            raise ConnectionError("DeepL API key not configured.")
-
-        # DeepL uses 2-letter language codes, so we extract them.
-        src_lang = source_language[:2].upper()
-        tgt_lang = target_language[:2].upper()
-
-        try:
-            result = await asyncio.to_thread(
-                self.translator.translate_text,
-                text,
-                source_lang=src_lang,
-                target_lang=tgt_lang
-            )
-            return result.text
-        except Exception as e:
-            logger.error(f"DeepL translation failed: {e}", exc_info=True)
-            raise
+        results = await self._translate_batch(
+            [text],
+            source_language=source_language,
+            target_language=target_language
+        )
+        return results[0] if results else ""
 
     async def _translate_batch(
         self, texts: List[str], source_language: str, target_language: str, **kwargs
     ) -> List[str]:
-        """Translate a batch of texts using DeepL."""
-        if not self.translator:
+        """Translate a batch of texts using DeepL.
+
+        Texts are sent DEEPL_MAX_TEXTS (and at most DEEPL_MAX_CHARS characters)
+        at a time over one keep-alive session, with at most ``concurrency``
+        requests in flight.
+        """
+        if not self.api_key:
             raise ConnectionError("DeepL API key not configured.")
+        if not texts:
+            return []
 
-        src_lang = source_language[:2].upper()
-        tgt_lang = target_language[:2].upper()
+        # DeepL uses upper-case ISO 639-1 codes (e.g., 'ES' instead of 'spa_Latn')
+        src_lang = _deepl_language(source_language)
+        tgt_lang = _deepl_language(target_language)
+
+        session = await self._get_session()
+        unique_texts, indices = _dedupe(texts)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _translate_chunk(chunk):
+            payload = {
+                'text': chunk,
+                'source_lang': src_lang,
+                'target_lang': tgt_lang
+            }
+            async with semaphore:
+                result = await _post_json(session, self.api_url, payload)
+            return _fit_translations([translation['text'] for translation in result['translations']], len(chunk))
 
         try:
-            results = await asyncio.to_thread(
-                self.translator.translate_text,
-                texts,
-                source_lang=src_lang,
-                target_lang=tgt_lang
-            )
-            return [r.text for r in results]
+            chunks = await asyncio.gather(*(
+                _translate_chunk(chunk)
+                for chunk in _pack_texts(unique_texts, DEEPL_MAX_TEXTS, DEEPL_MAX_CHARS)
+            ))
+        except asyncio.TimeoutError:
+            raise Exception("Translation request timed out")
         except Exception as e:
-            logger.error(f"DeepL batch translation failed: {e}", exc_info=True)
+            logger.error("DeepL batch translation failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             raise
+        translated_texts = [text for chunk in chunks for text in chunk]
+        return [translated_texts[i] for i in indices]
+
+    async def close(self):
+        """Release the HTTP session; it is closed once no translator uses it."""
+        if self.session is not None:
+            session, self.session = self.session, None
+            await _release_session(self._session_handle, session)
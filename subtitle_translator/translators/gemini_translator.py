@@ -3,9 +3,12 @@
 import asyncio
 import logging
 import os
+import random
+import re
 from typing import Dict, Any, List, Optional
 
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 
 from .base import BaseTranslator
 
@@ -23,9 +26,27 @@ GEMINI_PRICING = {
     },
 }
 
+# Attempts per Gemini request when it is rate limited (429) or the service fails (5xx)
+GEMINI_MAX_ATTEMPTS = 5
+
+# Appended to the prompt when several subtitle texts are translated at once
+BATCH_INSTRUCTIONS = (
+    "The text consists of numbered lines, each starting with a marker such as [1]. "
+    "Translate every line separately and return each translation on its own line, "
+    "starting with the same marker. Keep any <br> tags where they are."
+)
+
+# A "[n] translation" line in a batch response
+_NUMBERED_LINE_RE = re.compile(r'^\s*\[(\d+)\]\s?(.*)$', re.MULTILINE)
+
 class GeminiTranslator(BaseTranslator):
     """Translator using the Google Gemini API."""
 
+    # Estimated input tokens of subtitle text packed into one prompt
+    PROMPT_TOKEN_BUDGET = 3500
+    # Most subtitle texts sent together in one prompt, however short
+    PROMPT_BATCH_SIZE = 100
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize the Gemini translator."""
         super().__init__(config)
@@ -47,93 +68,198 @@ class GeminiTranslator(BaseTranslator):
             logger.warning("No Gemini API key found in GUI settings or environment variable. Translation will likely fail.")
 
         self.model = genai.GenerativeModel('gemini-2.5-flash-preview-05-20')
+        # Price per 1,000 tokens of the model, or None if unknown
+        self._pricing = GEMINI_PRICING.get(self.model.model_name.split('/')[-1])
         self.prompt_template = self.config.get(
             'prompt_template',
             "Translate the following text from {source_language} to {target_language}. Please provide only the translated text, without any additional explanations or context. Maintain the original meaning and tone as much as possible."
         )
         self.tone = self.config.get('tone', '')
+        # Most Gemini requests in flight at once
+        self.concurrency = int(self.config.get('concurrency') or 8)
 
     async def translate_text(
         self, text: str, source_language: str, target_language: str, **kwargs
     ) -> str:
-        """Translate a single text string using Gemini."""
-        if not self.api_key:
-            raise ConnectionError("Gemini API key not configured.")
+        """Translate a single text string using Gemini.
+
+        Raises:
+            Exception: If the text could not be translated
+        """
+        results = await self._translate_batch(
+            [text],
+            source_language=source_language,
+            target_language=target_language,
+            raise_errors=True
+        )
+        return results[0] if results else ""
+
+    def _usage_cost(self, response) -> tuple:
+        """Get the prompt tokens, candidate tokens and cost of a response."""
+        if not getattr(response, 'usage_metadata', None):
+            return 0, 0, 0.0
+        prompt_tokens = response.usage_metadata.prompt_token_count
+        candidates_tokens = response.usage_metadata.candidates_token_count
+
+        cost = 0.0
+        pricing = self._pricing
+        if pricing:
+            cost = (prompt_tokens / 1000) * pricing['input'] + (candidates_tokens / 1000) * pricing['output']
+        return prompt_tokens, candidates_tokens, cost
 
-        prompt = self.prompt_template.format(
+    async def _generate(self, prompt: str, semaphore: asyncio.Semaphore):
+        """Run one Gemini request, retrying with backoff when rate limited or on server errors."""
+        for attempt in range(GEMINI_MAX_ATTEMPTS):
+            try:
+                async with semaphore:
+                    return await self.model.generate_content_async(prompt)
+            except (google_exceptions.TooManyRequests, google_exceptions.ServerError) as e:
+                if attempt == GEMINI_MAX_ATTEMPTS - 1:
+                    raise
+                delay = min(2 ** attempt, 30) + random.random()
+                logger.warning(f"Gemini request failed ({e}); retrying in {delay:.1f}s.")
+                await asyncio.sleep(delay)
+
+    def _prompt_parts(self, source_language: str, target_language: str) -> List[str]:
+        """Format the prompt template once for a language pair.
+
+        Returns:
+            The pieces of the prompt around its {TEXT} placeholders, so that a
+            prompt is built with ``text.join(parts)``
+        """
+        return self.prompt_template.format(
             source_language=source_language,
             target_language=target_language,
             LANG=target_language,
-            TEXT=text,
+            TEXT='\x00',
             TONE=self.tone
+        ).split('\x00')
+
+    @staticmethod
+    def _text_prompt(text: str, prompt_parts: List[str]) -> str:
+        """Build the prompt asking for the translation of a single text."""
+        prompt = text.join(prompt_parts)
+        # A template without a {TEXT} placeholder gets the text appended
+        if len(prompt_parts) == 1:
+            prompt = f"{prompt}\n\n{text}"
+        return prompt
+
+    def _batch_prompt(self, texts: List[str], prompt_parts: List[str]) -> str:
+        """Build one prompt asking for the translation of several numbered lines."""
+        # Line breaks inside a subtitle are sent as <br> so every text stays on one numbered line
+        numbered = "\n".join(
+            f"[{i}] {text.replace(chr(10), '<br>')}" for i, text in enumerate(texts, 1)
         )
-        try:
-            response = await self.model.generate_content_async(prompt)
-            if hasattr(response, 'usage_metadata') and response.usage_metadata:
-                prompt_tokens = response.usage_metadata.prompt_token_count
-                candidates_tokens = response.usage_metadata.candidates_token_count
-                total_tokens = response.usage_metadata.total_token_count
-
-                model_name = self.model.model_name.split('/')[-1]
-                pricing = GEMINI_PRICING.get(model_name)
-                cost_info = ""
-                if pricing:
-                    input_cost = (prompt_tokens / 1000) * pricing['input']
-                    output_cost = (candidates_tokens / 1000) * pricing['output']
-                    total_cost = input_cost + output_cost
-                    cost_info = f" | Cost: <font color=\"lightgreen\">${total_cost:.6f}</font>"
-                
-                logger.info(f"Gemini token usage: <font color=\"cyan\">{prompt_tokens}</font> (prompt) + <font color=\"magenta\">{candidates_tokens}</font> (candidates) = <font color=\"yellow\">{total_tokens}</font> total tokens.{cost_info}")
-            return response.text
-        except Exception as e:
-            logger.error(f"Gemini translation failed: {e}", exc_info=True)
-            raise
+        prompt = f"{numbered.join(prompt_parts)}\n\n{BATCH_INSTRUCTIONS}"
+        if len(prompt_parts) == 1:
+            prompt = f"{prompt}\n\n{numbered}"
+        return prompt
+
+    @classmethod
+    def _pack_chunks(cls, texts: List[str]) -> List[List[str]]:
+        """Split texts into prompt-sized chunks by estimated token count.
+
+        Tokens are estimated as four characters each. A chunk is closed when
+        the next text would exceed PROMPT_TOKEN_BUDGET or PROMPT_BATCH_SIZE.
+        """
+        chunks = []
+        chunk = []
+        chunk_tokens = 0
+        for text in texts:
+            tokens = max(1, len(text) // 4)
+            if chunk and (chunk_tokens + tokens > cls.PROMPT_TOKEN_BUDGET
+                          or len(chunk) == cls.PROMPT_BATCH_SIZE):
+                chunks.append(chunk)
+                chunk = []
+                chunk_tokens = 0
+            chunk.append(text)
+            chunk_tokens += tokens
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    @staticmethod
+    def _parse_batch_response(text: str, count: int) -> Optional[List[str]]:
+        """Split a numbered batch response into ``count`` translations.
+
+        Returns None if any line is missing, so the caller can fall back.
+        """
+        translations = {}
+        for number, translation in _NUMBERED_LINE_RE.findall(text):
+            translations[int(number)] = translation.strip().replace('<br>', '\n')
+        if any(i not in translations for i in range(1, count + 1)):
+            return None
+        return [translations[i] for i in range(1, count + 1)]
 
     async def _translate_batch(
         self, texts: List[str], source_language: str, target_language: str, **kwargs
     ) -> List[str]:
-        """Translate a batch of texts using Gemini, running requests concurrently."""
+        """Translate a batch of texts using Gemini.
+
+        Texts are packed into chunks by estimated token count (see _pack_chunks)
+        and each chunk is sent as numbered lines in a single prompt, with at
+        most ``concurrency`` prompts in flight. A prompt whose response cannot
+        be matched back to its lines is retried one text at a time. A lone
+        text is sent with the plain prompt.
+
+        Texts that fail are returned empty and logged, unless ``raise_errors``
+        is passed, in which case the first failure is raised.
+        """
         if not self.api_key:
             raise ConnectionError("Gemini API key not configured.")
 
+        semaphore = asyncio.Semaphore(self.concurrency)
+        prompt_parts = self._prompt_parts(source_language, target_language)
+
         total_prompt_tokens = 0
         total_candidates_tokens = 0
         total_cost = 0.0
+        # (text, error) of every text that could not be translated
+        failures = []
 
-        async def _translate(text):
+        def _add_usage(response):
             nonlocal total_prompt_tokens, total_candidates_tokens, total_cost
-            prompt = self.prompt_template.format(
-                source_language=source_language,
-                target_language=target_language,
-                LANG=target_language,
-                TEXT=text,
-                TONE=self.tone
-            )
-            try:
-                response = await self.model.generate_content_async(prompt)
-                if hasattr(response, 'usage_metadata') and response.usage_metadata:
-                    prompt_tokens = response.usage_metadata.prompt_token_count
-                    candidates_tokens = response.usage_metadata.candidates_token_count
-                    total_prompt_tokens += prompt_tokens
-                    total_candidates_tokens += candidates_tokens
-
-                    model_name = self.model.model_name.split('/')[-1]
-                    pricing = GEMINI_PRICING.get(model_name)
-                    if pricing:
-                        input_cost = (prompt_tokens / 1000) * pricing['input']
-                        output_cost = (candidates_tokens / 1000) * pricing['output']
-                        total_cost += input_cost + output_cost
+            prompt_tokens, candidates_tokens, cost = self._usage_cost(response)
+            total_prompt_tokens += prompt_tokens
+            total_candidates_tokens += candidates_tokens
+            total_cost += cost
 
+        async def _translate(text):
+            prompt = self._text_prompt(text, prompt_parts)
+            try:
+                response = await self._generate(prompt, semaphore)
+                _add_usage(response)
                 return response.text
             except Exception as e:
-                logger.error(f"Gemini translation for '{text}' failed: {e}")
+                failures.append((text, e))
                 return ""  # Return empty string on failure
 
-        tasks = [_translate(text) for text in texts]
-        translated_texts = await asyncio.gather(*tasks)
+        async def _translate_chunk(chunk):
+            if len(chunk) == 1:
+                return [await _translate(chunk[0])]
+            prompt = self._batch_prompt(chunk, prompt_parts)
+            try:
+                response = await self._generate(prompt, semaphore)
+                _add_usage(response)
+                translations = self._parse_batch_response(response.text, len(chunk))
+                if translations is not None:
+                    return translations
+                logger.warning(f"Gemini response did not match the {len(chunk)} requested lines; translating them one by one.")
+            except Exception as e:
+                logger.warning(f"Gemini batch translation failed: {e}; translating the lines one by one.")
+            return await asyncio.gather(*(_translate(text) for text in chunk))
+
+        translated_chunks = await asyncio.gather(*(_translate_chunk(chunk) for chunk in self._pack_chunks(texts)))
+        translated_texts = [text for chunk in translated_chunks for text in chunk]
+
+        if failures:
+            samples = "; ".join(f"'{text}': {e}" for text, e in failures[:3])
+            logger.error(f"Gemini translation failed for {len(failures)} of {len(texts)} texts. First failures: {samples}")
+            if kwargs.get('raise_errors'):
+                raise failures[0][1]
         
         total_tokens = total_prompt_tokens + total_candidates_tokens
-        cost_info = f" | Total Cost: <font color=\"lightgreen\">${total_cost:.6f}</font>" if total_cost > 0 else ""
-        logger.info(f"Gemini batch translation completed. Total tokens: <font color=\"cyan\">{total_prompt_tokens}</font> (prompt) + <font color=\"magenta\">{total_candidates_tokens}</font> (candidates) = <font color=\"yellow\">{total_tokens}</font>.{cost_info}")
+        cost_info = f" | Total Cost: ${total_cost:.6f}" if total_cost > 0 else ""
+        logger.info(f"Gemini batch translation completed. Total tokens: {total_prompt_tokens} (prompt) + {total_candidates_tokens} (candidates) = {total_tokens}.{cost_info}")
         
         return translated_texts
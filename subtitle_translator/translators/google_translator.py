@@ -1,22 +1,72 @@
 """Google Translate implementation."""
 
+import asyncio
+import functools
 import logging
+import os
 from typing import Dict, Any, Optional, List
 
-from google.cloud import translate_v2 as translate
+import google.auth
+from google.cloud import translate_v3
 
-from .base import BaseTranslator
+from ..utils.languages import NLLB_TO_ISO
+from .base import BaseTranslator, _dedupe, _fit_translations, _pack_texts
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=64)
+def _google_language(code: str) -> str:
+    """Get the Google language code for an NLLB code such as 'eng_Latn'.
+
+    Unknown codes fall back to the part before the script ('eng_Latn' -> 'eng'),
+    so codes that are already short pass through unchanged.
+    """
+    return NLLB_TO_ISO.get(code) or code.split('_', 1)[0]
+
+# Most texts, and most characters (code points) in total, the v3 API
+# accepts in a single translate_text request
+GOOGLE_MAX_TEXTS = 1024
+GOOGLE_MAX_CHARS = 30000
+
 class GoogleTranslator(BaseTranslator):
-    """Translator using Google Cloud Translation API."""
-    
+    """Translator using Google Cloud Translation API (v3, over gRPC)."""
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
-        """Initialize the Google translator."""
+        """Initialize the Google translator.
+
+        The Google Cloud project is taken from the 'project_id' setting, the
+        GOOGLE_CLOUD_PROJECT environment variable or the default credentials.
+        """
         super().__init__(config)
-        self.client = translate.Client()
-    
+        project_id = self.config.get('project_id') or os.environ.get('GOOGLE_CLOUD_PROJECT')
+        if not project_id:
+            _, project_id = google.auth.default()
+        self.parent = f"projects/{project_id}/locations/{self.config.get('location') or 'global'}"
+        # Most translate_text requests in flight at once
+        self.concurrency = int(self.config.get('concurrency') or 8)
+        self.client = None
+
+    def _get_client(self) -> translate_v3.TranslationServiceAsyncClient:
+        """Get or create the gRPC client; it keeps one channel open for all requests."""
+        if self.client is None:
+            self.client = translate_v3.TranslationServiceAsyncClient()
+        return self.client
+
+    async def translate_text(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str,
+        **kwargs
+    ) -> str:
+        """Translate a single text string."""
+        results = await self._translate_batch(
+            [text],
+            source_language=source_language,
+            target_language=target_language
+        )
+        return results[0] if results else ""
+
     async def _translate_batch(
         self,
         texts: List[str],
@@ -24,18 +74,49 @@ class GoogleTranslator(BaseTranslator):
         target_language: str,
         **kwargs
     ) -> List[str]:
-        """Translate a batch of text strings using Google Translate."""
+        """Translate a batch of text strings using Google Translate.
+
+        The distinct texts are packed into requests within the API's text and
+        character limits, with at most ``concurrency`` requests in flight.
+        """
+        if not texts:
+            return []
         try:
-            # The v2 API uses language codes without the script part (e.g., 'en' instead of 'eng_Latn')
-            source_lang_short = source_language.split('_')[0]
-            target_lang_short = target_language.split('_')[0]
-
-            results = self.client.translate(
-                texts,
-                source_language=source_lang_short,
-                target_language=target_lang_short
-            )
-            return [result['translatedText'] for result in results]
+            # The API uses ISO 639-1 codes (e.g., 'en' instead of 'eng_Latn')
+            source_lang_short = _google_language(source_language)
+            target_lang_short = _google_language(target_language)
+
+            # Each distinct text is sent, and billed, once
+            unique_texts, indices = _dedupe(texts)
+            client = self._get_client()
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def _send(chunk):
+                async with semaphore:
+                    return await client.translate_text(
+                        parent=self.parent,
+                        contents=chunk,
+                        source_language_code=source_lang_short,
+                        target_language_code=target_lang_short,
+                        mime_type="text/plain"
+                    )
+
+            chunks = _pack_texts(unique_texts, GOOGLE_MAX_TEXTS, GOOGLE_MAX_CHARS)
+            responses = await asyncio.gather(*(_send(chunk) for chunk in chunks))
+            translated_texts = [
+                text
+                for chunk, response in zip(chunks, responses)
+                for text in _fit_translations(
+                    [translation.translated_text for translation in response.translations], len(chunk)
+                )
+            ]
+            return [translated_texts[i] for i in indices]
         except Exception as e:
-            logger.error(f"Google Translate batch failed: {e}", exc_info=True)
+            logger.error("Google Translate batch failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             raise
+
+    async def close(self):
+        """Close the gRPC channel."""
+        if self.client is not None:
+            await self.client.transport.close()
+            self.client = None
@@ -6,7 +6,10 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 import aiohttp
 
-from .base import BaseTranslator
+from .base import (
+    BaseTranslator, HTTP_CONNECTOR_OPTIONS, _acquire_session, _dedupe, _json_dumps,
+    _post_json, _release_session
+)
 
 logger = logging.getLogger(__name__)
 
@@ -20,17 +23,26 @@ class HFTranslator(BaseTranslator):
         self.model_name = self.config.get('model_name', 'facebook/nllb-200-distilled-600M')
         self.api_url = f"https://api-inference.huggingface.co/models/{self.model_name}"
         self.timeout = aiohttp.ClientTimeout(total=float(self.config.get('timeout', 300)))
+        # Most batches sent to the API at once
+        self.concurrency = int(self.config.get('concurrency') or 4)
+        # Gzip request bodies; the endpoint must accept Content-Encoding: gzip
+        self.compress_requests = bool(self.config.get('compress_requests', False))
         self.session = None
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create an aiohttp client session."""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(
-                timeout=self.timeout,
-                headers={
-                    'Authorization': f"Bearer {self.api_key}",
-                    'Content-Type': 'application/json'
-                }
+        """Get the aiohttp session shared by translators with the same API key and timeout."""
+        if self.session is None:
+            self.session, self._session_handle = _acquire_session(
+                ('huggingface', self.api_key, self.timeout.total),
+                lambda: aiohttp.ClientSession(
+                    timeout=self.timeout,
+                    connector=aiohttp.TCPConnector(**HTTP_CONNECTOR_OPTIONS),
+                    json_serialize=_json_dumps,
+                    headers={
+                        'Authorization': f"Bearer {self.api_key}",
+                        'Content-Type': 'application/json'
+                    }
+                )
             )
         return self.session
     
@@ -49,6 +61,32 @@ class HFTranslator(BaseTranslator):
         )
         return results[0] if results else ""
     
+    async def _post_batch(
+        self,
+        session: aiohttp.ClientSession,
+        batch: List[str],
+        source_language: str,
+        target_language: str
+    ) -> List[str]:
+        """Send one batch to the Inference API and return its translations."""
+        payload = {
+            'inputs': batch,
+            'options': {'wait_for_model': True}
+        }
+        if source_language and target_language:
+            payload['inputs'] = {
+                'text': batch,
+                'src_lang': source_language,
+                'tgt_lang': target_language
+            }
+
+        result = await _post_json(session, self.api_url, payload, self.compress_requests)
+        if isinstance(result, list):
+            return [item.get('translation_text', '') for item in result]
+        elif isinstance(result, dict) and 'translation_text' in result:
+            return [result['translation_text']]
+        raise Exception(f"Unexpected response format: {result}")
+    
     async def _translate_batch(
         self,
         texts: List[str],
@@ -56,46 +94,46 @@ class HFTranslator(BaseTranslator):
         target_language: str,
         **kwargs
     ) -> List[str]:
-        """Translate a batch of text segments."""
+        """Translate a batch of text segments.
+        
+        The model pads every request to its longest text, so the texts are
+        sorted by length and sent in ``batch_size`` buckets of similar length,
+        at most ``concurrency`` at a time.
+        """
         if not texts:
             return []
         
+        batch_size = kwargs.get('batch_size', self.batch_size)
         session = await self._get_session()
+        unique_texts, indices = _dedupe(texts)
+        order = sorted(range(len(unique_texts)), key=lambda i: len(unique_texts[i]))
+        buckets = [order[i:i + batch_size] for i in range(0, len(order), batch_size)]
+        semaphore = asyncio.Semaphore(self.concurrency)
         
-        payload = {
-            'inputs': texts,
-            'options': {'wait_for_model': True}
-        }
-        if source_language and target_language:
-            payload['inputs'] = {
-                'text': texts,
-                'src_lang': source_language,
-                'tgt_lang': target_language
-            }
+        async def _send(bucket):
+            async with semaphore:
+                return await self._post_batch(
+                    session, [unique_texts[i] for i in bucket], source_language, target_language
+                )
 
         try:
-            async with session.post(self.api_url, json=payload) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"Translation request failed with status {response.status}: {error_text}")
-                
-                result = await response.json()
-                
-                if isinstance(result, list):
-                    return [item.get('translation_text', '') for item in result]
-                elif isinstance(result, dict) and 'translation_text' in result:
-                    return [result['translation_text']]
-                else:
-                    raise Exception(f"Unexpected response format: {result}")
-                    
+            results = await asyncio.gather(*(_send(bucket) for bucket in buckets))
         except asyncio.TimeoutError:
             raise Exception("Translation request timed out")
         except Exception as e:
             logger.error(f"Translation request failed: {e}")
             raise
+        
+        # Put the translations back in input order; texts the API returned no
+        # translation for are left empty
+        translated_texts = [''] * len(unique_texts)
+        for bucket, result in zip(buckets, results):
+            for i, translation in zip(bucket, result):
+                translated_texts[i] = translation
+        return [translated_texts[i] for i in indices]
     
     async def close(self):
-        """Close the HTTP session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
-            self.session = None
+        """Release the HTTP session; it is closed once no translator uses it."""
+        if self.session is not None:
+            session, self.session = self.session, None
+            await _release_session(self._session_handle, session)
@@ -7,12 +7,18 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 import aiohttp
 
-from .base import BaseTranslator
+from .base import (
+    BaseTranslator, HTTP_CONNECTOR_OPTIONS, _acquire_session, _dedupe, _fit_translations,
+    _json_dumps, _post_json, _release_session
+)
 
 logger = logging.getLogger(__name__)
 
 class LocalNLLBTranslator(BaseTranslator):
     """Translator using a local NLLB server."""
+
+    # The endpoint is read per request, so it can change without a new session
+    _REBINDABLE_KEYS = BaseTranslator._REBINDABLE_KEYS | {'endpoint'}
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize the NLLB translator.
@@ -22,16 +28,36 @@ class LocalNLLBTranslator(BaseTranslator):
                 - endpoint: URL of the NLLB server
                 - batch_size: Number of text segments to translate in a single batch
                 - timeout: Request timeout in seconds
+                - concurrency: Number of batches sent to the server at once
+                - compress_requests: Gzip request bodies (the server must support it)
         """
         super().__init__(config)
         self.endpoint = self.config.get('endpoint', 'http://localhost:8080/translate')
         self.timeout = aiohttp.ClientTimeout(total=float(self.config.get('timeout', 300)))
+        # Most sub-batches sent to the server at once
+        self.concurrency = int(self.config.get('concurrency') or 4)
+        # Gzip request bodies; the server must accept Content-Encoding: gzip
+        self.compress_requests = bool(self.config.get('compress_requests', False))
         self.session = None
     
+    def rebind(self, config: Dict[str, Any]) -> bool:
+        """Apply a new configuration, including a new endpoint, in place."""
+        if not super().rebind(config):
+            return False
+        self.endpoint = self.config.get('endpoint', 'http://localhost:8080/translate')
+        return True
+    
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create an aiohttp client session."""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(timeout=self.timeout)
+        """Get the aiohttp session shared by translators with the same timeout."""
+        if self.session is None:
+            self.session, self._session_handle = _acquire_session(
+                ('local_nllb', self.timeout.total),
+                lambda: aiohttp.ClientSession(
+                    timeout=self.timeout,
+                    connector=aiohttp.TCPConnector(**HTTP_CONNECTOR_OPTIONS),
+                    json_serialize=_json_dumps
+                )
+            )
         return self.session
     
     async def translate_text(
@@ -49,6 +75,29 @@ class LocalNLLBTranslator(BaseTranslator):
         )
         return results[0] if results else ""
     
+    async def _post_batch(
+        self,
+        session: aiohttp.ClientSession,
+        batch: List[str],
+        source_language: str,
+        target_language: str
+    ) -> List[str]:
+        """Send one sub-batch to the NLLB server and return its translations."""
+        payload = {
+            'source': batch,
+            'src_lang': source_language,
+            'tgt_lang': target_language
+        }
+        
+        result = await _post_json(session, self.endpoint, payload, self.compress_requests)
+        if isinstance(result, dict) and 'translation' in result:
+            result = result['translation']
+        if isinstance(result, str):
+            result = [result]
+        if isinstance(result, list):
+            return _fit_translations(result, len(batch))
+        raise Exception(f"Unexpected response format: {result}")
+    
     async def _translate_batch(
         self,
         texts: List[str],
@@ -56,56 +105,41 @@ class LocalNLLBTranslator(BaseTranslator):
         target_language: str,
         **kwargs
     ) -> List[str]:
-        """Translate a batch of text segments."""
+        """Translate a batch of text segments.
+        
+        The texts are split into sub-batches of ``batch_size``, which are sent
+        concurrently, at most ``concurrency`` at a time.
+        """
         if not texts:
             return []
         
         batch_size = kwargs.get('batch_size', self.batch_size)
-        translated_texts = []
+        unique_texts, indices = _dedupe(texts)
+        session = await self._get_session()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def _send(batch):
+            async with semaphore:
+                return await self._post_batch(session, batch, source_language, target_language)
         
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            
-            payload = {
-                'source': batch,
-                'src_lang': source_language,
-                'tgt_lang': target_language
-            }
-            
-            session = await self._get_session()
-            
-            try:
-                async with session.post(
-                    self.endpoint,
-                    json=payload,
-                    headers={'Content-Type': 'application/json'}
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise Exception(f"Translation request failed with status {response.status}: {error_text}")
-                    
-                    result = await response.json()
-                    if isinstance(result, str):
-                        translated_texts.append(result)
-                    elif isinstance(result, dict) and 'translation' in result:
-                        if isinstance(result['translation'], list):
-                            translated_texts.extend(result['translation'])
-                        else:
-                            translated_texts.append(result['translation'])
-                    elif isinstance(result, list):
-                        translated_texts.extend(result)
-                    else:
-                        raise Exception(f"Unexpected response format: {result}")
-            except asyncio.TimeoutError:
-                raise Exception("Translation request timed out")
-            except Exception as e:
-                logger.error(f"Translation request failed: {e}")
-                raise
+        try:
+            results = await asyncio.gather(*(
+                _send(unique_texts[i:i + batch_size])
+                for i in range(0, len(unique_texts), batch_size)
+            ))
+        except asyncio.TimeoutError:
+            raise Exception("Translation request timed out")
+        except Exception as e:
+            logger.error(f"Translation request failed: {e}")
+            raise
         
-        return translated_texts
+        translated_texts = [text for result in results for text in result]
+        if len(unique_texts) == len(texts):
+            return translated_texts
+        return [translated_texts[i] for i in indices]
     
     async def close(self):
-        """Close the HTTP session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
-            self.session = None
+        """Release the HTTP session; it is closed once no translator uses it."""
+        if self.session is not None:
+            session, self.session = self.session, None
+            await _release_session(self._session_handle, session)
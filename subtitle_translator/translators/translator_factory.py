@@ -1,26 +1,31 @@
 """Factory for creating translator instances."""
 
-from typing import Dict, Type, Optional, Any
+import importlib
+from typing import Dict, Type, Optional, Any, Tuple
 
+from ..core.exceptions import ConfigurationError
 from .base import BaseTranslator
 from .local_nllb_translator import LocalNLLBTranslator
 from .hf_translator import HFTranslator
-from .google_translator import GoogleTranslator
 from .deepl_translator import DeepLTranslator
-from .gemini_translator import GeminiTranslator
 
 class TranslatorFactory:
     """Factory class for creating translator instances."""
-    
+
     # Map of translator types to their corresponding classes
     _translators: Dict[str, Type[BaseTranslator]] = {
         'local_nllb': LocalNLLBTranslator,
         'huggingface': HFTranslator,
-        'google': GoogleTranslator,
         'deepl': DeepLTranslator,
-        'gemini': GeminiTranslator,
     }
-    
+
+    # Translators backed by optional SDKs, imported on first use:
+    # translator type -> (module, class name, extra that installs the SDK)
+    _optional_translators: Dict[str, Tuple[str, str, str]] = {
+        'google': ('.google_translator', 'GoogleTranslator', 'google'),
+        'gemini': ('.gemini_translator', 'GeminiTranslator', 'gemini'),
+    }
+
     @classmethod
     def register_translator(
         cls,
@@ -28,7 +33,7 @@ class TranslatorFactory:
         translator_class: Type[BaseTranslator]
     ) -> None:
         """Register a new translator type.
-        
+
         Args:
             translator_type: Unique identifier for the translator type
             translator_class: Translator class to register
@@ -39,12 +44,46 @@ class TranslatorFactory:
                 f"got {translator_class.__name__}"
             )
         cls._translators[translator_type] = translator_class
-    
+
+    @classmethod
+    def _load_optional_translator(cls, translator_type: str) -> Type[BaseTranslator]:
+        """Import an SDK-backed translator class and register it.
+
+        Args:
+            translator_type: Type of translator to load
+
+        Returns:
+            The translator class
+
+        Raises:
+            ConfigurationError: If the SDK for the translator is not installed
+        """
+        module_name, class_name, extra = cls._optional_translators[translator_type]
+        try:
+            module = importlib.import_module(module_name, __package__)
+        except ImportError as e:
+            raise ConfigurationError(
+                f"The '{translator_type}' translator requires additional dependencies "
+                f"({e.name or e}). Install them with: pip install 'subtitle-translator[{extra}]'"
+            ) from e
+        translator_class = getattr(module, class_name)
+        cls._translators[translator_type] = translator_class
+        return translator_class
+
     @classmethod
     def get_available_translators(cls) -> Dict[str, Type[BaseTranslator]]:
-        """Get a dictionary of available translator types and their classes."""
+        """Get a dictionary of available translator types and their classes.
+
+        Translators whose optional dependencies are not installed are omitted.
+        """
+        for translator_type in cls._optional_translators:
+            if translator_type not in cls._translators:
+                try:
+                    cls._load_optional_translator(translator_type)
+                except ConfigurationError:
+                    pass
         return dict(cls._translators)
-    
+
     @classmethod
     def create_translator(
         cls,
@@ -52,22 +91,26 @@ class TranslatorFactory:
         config: Optional[Dict[str, Any]] = None
     ) -> BaseTranslator:
         """Create a new translator instance.
-        
+
         Args:
             translator_type: Type of translator to create
             config: Configuration for the translator
-            
+
         Returns:
             An instance of the specified translator type
-            
+
         Raises:
             ValueError: If the specified translator type is not registered
+            ConfigurationError: If the translator's optional dependencies are missing
         """
         translator_class = cls._translators.get(translator_type)
+        if not translator_class and translator_type in cls._optional_translators:
+            translator_class = cls._load_optional_translator(translator_type)
         if not translator_class:
+            known_types = {**cls._translators, **cls._optional_translators}
             raise ValueError(
                 f"Unknown translator type: {translator_type}. "
-                f"Available types: {', '.join(cls._translators.keys())}"
+                f"Available types: {', '.join(known_types.keys())}"
             )
-        
+
         return translator_class(config or {})
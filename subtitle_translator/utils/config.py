@@ -1,5 +1,6 @@
 """Configuration management for the subtitle translator."""
 
+import dataclasses
 import json
 import logging
 import os
@@ -19,6 +20,10 @@ class ConfigManager:
             'model_name': 'facebook/nllb-200-distilled-600M',
             'batch_size': 5,
             'timeout': 300,
+            'request_concurrency': None,  # Requests sent at once; None uses the backend default
+            'compress_requests': False,  # Gzip request bodies (the server must accept it)
+            'project_id': None,  # Google Cloud project for the google backend
+            'location': 'global',  # Google Cloud Translation location
         },
         'languages': {
             'source': 'eng_Latn',
@@ -57,8 +62,8 @@ class ConfigManager:
             config_path: Path to the configuration file. If None, uses default location.
         """
         if config_path is None:
-            self.config_dir = Path.home() / '.config' / 'subtitle-translator'
-            self.config_path = self.config_dir / 'config.json'
+            self.config_path = self.default_config_path()
+            self.config_dir = self.config_path.parent
         else:
             self.config_path = Path(config_path)
             self.config_dir = self.config_path.parent
@@ -69,6 +74,35 @@ class ConfigManager:
         # Load or create config
         self._config = self._load_config()
     
+    @staticmethod
+    def default_config_path() -> Path:
+        """Get the location of the user configuration file."""
+        return Path.home() / '.config' / 'subtitle-translator' / 'config.json'
+    
+    @classmethod
+    def load_available_languages(cls, config_path: Optional[Union[str, Path]] = None) -> Dict[str, str]:
+        """Read only the available languages from a configuration file.
+        
+        Unlike constructing a ConfigManager, this neither creates the config
+        directory nor builds the full merged configuration.
+        
+        Args:
+            config_path: Path to the configuration file. If None, uses default location.
+            
+        Returns:
+            Dictionary mapping language codes to display names
+        """
+        path = Path(config_path) if config_path is not None else cls.default_config_path()
+        languages = dict(cls.DEFAULT_CONFIG['languages']['available'])
+        try:
+            if path.exists():
+                with open(path, 'r', encoding='utf-8') as f:
+                    config = json.load(f)
+                languages.update(config.get('languages', {}).get('available', {}))
+        except Exception as e:
+            logger.warning(f"Failed to load languages from {path}: {e}")
+        return languages
+    
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file or create default if not exists."""
         try:
@@ -109,6 +143,8 @@ class ConfigManager:
             return {k: self._convert_to_serializable(v) for k, v in obj.items()}
         elif isinstance(obj, list):
             return [self._convert_to_serializable(item) for item in obj]
+        elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):  # Handle (slotted) dataclasses
+            return self._convert_to_serializable(dataclasses.asdict(obj))
         elif hasattr(obj, '__dict__'):  # Handle objects with __dict__
             return self._convert_to_serializable(obj.__dict__)
         elif hasattr(obj, 'toPyObject'):  # Handle QVariant
@@ -0,0 +1,101 @@
+"""Language code tables shared by the core and the translation backends."""
+
+import types
+from typing import Mapping
+
+# Map langdetect's ISO 639-1 codes to NLLB language codes (read-only)
+ISO_TO_NLLB: Mapping[str, str] = types.MappingProxyType({
+    # Major European languages
+    'en': 'eng_Latn',  # English
+    'es': 'spa_Latn',  # Spanish
+    'fr': 'fra_Latn',  # French
+    'de': 'deu_Latn',  # German
+    'it': 'ita_Latn',  # Italian
+    'pt': 'por_Latn',  # Portuguese
+    'ru': 'rus_Cyrl',  # Russian
+    'nl': 'nld_Latn',  # Dutch
+    'pl': 'pol_Latn',  # Polish
+    'uk': 'ukr_Cyrl',  # Ukrainian
+    'tr': 'tur_Latn',  # Turkish
+    'ar': 'arb_Arab',  # Arabic
+    'zh': 'zho_Hans',  # Chinese Simplified
+    'zh-cn': 'zho_Hans',  # Chinese Simplified (as reported by langdetect)
+    'zh-tw': 'zho_Hant',  # Chinese Traditional
+    'ja': 'jpn_Jpan',  # Japanese
+    'ko': 'kor_Hang',  # Korean
+    'hi': 'hin_Deva',  # Hindi
+    'bn': 'ben_Beng',  # Bengali
+    'pa': 'pan_Guru',  # Punjabi
+    'ta': 'tam_Taml',  # Tamil
+    'te': 'tel_Telu',  # Telugu
+    'mr': 'mar_Deva',  # Marathi
+    'vi': 'vie_Latn',  # Vietnamese
+    'th': 'tha_Thai',  # Thai
+    'id': 'ind_Latn',  # Indonesian
+    'ms': 'zsm_Latn',  # Malay
+    'fil': 'tgl_Latn',  # Filipino
+    'sw': 'swh_Latn',  # Swahili
+    'ha': 'hau_Latn',  # Hausa
+    'yo': 'yor_Latn',  # Yoruba
+    'ig': 'ibo_Latn',  # Igbo
+    'am': 'amh_Ethi',  # Amharic
+    'zu': 'zul_Latn',  # Zulu
+    'xh': 'xho_Latn',  # Xhosa
+    'st': 'sot_Latn',  # Southern Sotho
+    'tn': 'tsn_Latn',  # Tswana
+    'sn': 'sna_Latn',  # Shona
+    'rw': 'kin_Latn',  # Kinyarwanda
+    'mg': 'plt_Latn',  # Malagasy
+    'so': 'som_Latn',  # Somali
+    'om': 'gaz_Latn',  # Oromo
+    'ti': 'tir_Ethi',  # Tigrinya
+    'he': 'heb_Hebr',  # Hebrew
+    'fa': 'pes_Arab',  # Persian
+    'ur': 'urd_Arab',  # Urdu
+    'ps': 'pbt_Arab',  # Pashto
+    'ku': 'kmr_Latn',  # Kurdish (Kurmanji)
+    'ckb': 'ckb_Arab',  # Central Kurdish
+    'ne': 'npi_Deva',  # Nepali
+    'si': 'sin_Sinh',  # Sinhala
+    'km': 'khm_Khmr',  # Khmer
+    'lo': 'lao_Laoo',  # Lao
+    'my': 'mya_Mymr',  # Burmese
+    'ka': 'kat_Geor',  # Georgian
+    'hy': 'hye_Armn',  # Armenian
+    'az': 'azj_Latn',  # Azerbaijani
+    'uz': 'uzn_Latn',  # Uzbek
+    'kk': 'kaz_Cyrl',  # Kazakh
+    'ky': 'kir_Cyrl',  # Kyrgyz
+    'tg': 'tgk_Cyrl',  # Tajik
+    'tk': 'tuk_Latn',  # Turkmen
+    'mn': 'khk_Cyrl',  # Mongolian
+    'bo': 'bod_Tibt',  # Tibetan
+    'dz': 'dzo_Tibt',  # Dzongkha
+    'ceb': 'ceb_Latn',  # Cebuano
+    'jv': 'jav_Latn',  # Javanese
+    'su': 'sun_Latn',  # Sundanese
+    'ml': 'mal_Mlym',  # Malayalam
+    'kn': 'kan_Knda',  # Kannada
+    'gu': 'guj_Gujr',  # Gujarati
+    'or': 'ory_Orya',  # Odia
+    'as': 'asm_Beng',  # Assamese
+    'mai': 'mai_Deva',  # Maithili
+    'sd': 'snd_Arab',  # Sindhi
+})
+
+# NLLB language code -> ISO 639-1 code; where several ISO codes map to one
+# NLLB code, the first listed (e.g. 'zh', not 'zh-cn') wins
+NLLB_TO_ISO: Mapping[str, str] = types.MappingProxyType(
+    {nllb: iso for iso, nllb in reversed(list(ISO_TO_NLLB.items()))}
+)
+
+def iso_to_nllb(code: str) -> str:
+    """Map an ISO 639-1 code (optionally with a region, e.g. ``pt-BR``) to NLLB.
+
+    Falls back to the bare language code and then to English.
+    """
+    code = code.lower()
+    nllb = ISO_TO_NLLB.get(code)
+    if nllb is None:
+        nllb = ISO_TO_NLLB.get(code.split('-', 1)[0], 'eng_Latn')
+    return nllb
@@ -0,0 +1,90 @@
+"""Persistent cache of translated subtitle lines."""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Default location of the line cache database
+DEFAULT_CACHE_PATH = Path.home() / '.cache' / 'subtitle-translator' / 'lines.sqlite3'
+
+# Most keys looked up in one SELECT; SQLite allows 999 parameters by default
+_LOOKUP_CHUNK_SIZE = 500
+
+class TranslationCache:
+    """SQLite-backed map from (backend, languages, text) to a translation.
+
+    A single connection is shared by all threads and guarded by a lock, so the
+    cache can be used from executor threads. Errors are logged and treated as
+    cache misses; the cache never makes a translation fail.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, ttl: Optional[float] = None):
+        """Open (and create if needed) the cache database.
+
+        Args:
+            path: Database file; defaults to DEFAULT_CACHE_PATH
+            ttl: Seconds an entry stays valid, or None to keep entries forever
+        """
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key BLOB PRIMARY KEY, val TEXT NOT NULL, created REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def key(namespace: str, source_language: str, target_language: str, text: str) -> bytes:
+        """Build the cache key of a text translated by a backend."""
+        return hashlib.blake2b(
+            f"{namespace}|{source_language}|{target_language}|{text}".encode('utf-8'),
+            digest_size=16
+        ).digest()
+
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, str]:
+        """Look up several keys at once.
+
+        Returns:
+            The translations found, by key
+        """
+        found = {}
+        min_created = time.time() - self.ttl if self.ttl else 0.0
+        try:
+            with self._lock:
+                for i in range(0, len(keys), _LOOKUP_CHUNK_SIZE):
+                    chunk = keys[i:i + _LOOKUP_CHUNK_SIZE]
+                    rows = self._conn.execute(
+                        f"SELECT key, val FROM cache WHERE created >= ? AND key IN ({','.join('?' * len(chunk))})",
+                        [min_created, *chunk]
+                    )
+                    found.update(rows)
+        except sqlite3.Error as e:
+            logger.warning(f"Translation cache lookup failed: {e}")
+        return found
+
+    def put_many(self, items: Dict[bytes, str]) -> None:
+        """Store several translations in one transaction."""
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO cache (key, val, created) VALUES (?, ?, ?)",
+                    [(key, val, now) for key, val in items.items()]
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Translation cache update failed: {e}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,128 @@
+"""Tests for the helpers shared by the translation backends."""
+
+import asyncio
+import gzip
+import json
+
+import pytest
+
+pytest.importorskip("pysubs2")
+pytest.importorskip("aiohttp")
+
+from subtitle_translator.translators import base
+from subtitle_translator.translators.base import HTTP_MAX_ATTEMPTS, _pack_texts, _post_json
+
+
+class FakeResponse:
+    def __init__(self, status, body=b'{}', headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    async def read(self):
+        return self.body
+
+    async def text(self):
+        return self.body.decode('utf-8')
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeSession:
+    """Session that answers POST requests with the given responses in turn."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def post(self, url, **kwargs):
+        self.requests.append((url, kwargs))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping, without jitter."""
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+    monkeypatch.setattr(base.asyncio, 'sleep', sleep)
+    monkeypatch.setattr(base.random, 'uniform', lambda a, b: 0.0)
+    return delays
+
+
+def test_post_json_returns_the_parsed_response(sleeps):
+    session = FakeSession(FakeResponse(200, b'{"translation": ["Hallo"]}'))
+
+    result = asyncio.run(_post_json(session, 'http://server/translate', {'source': ['Hello']}))
+
+    assert result == {'translation': ['Hallo']}
+    assert session.requests == [('http://server/translate', {'json': {'source': ['Hello']}})]
+    assert sleeps == []
+
+
+def test_post_json_waits_for_retry_after(sleeps):
+    session = FakeSession(
+        FakeResponse(429, b'slow down', {'Retry-After': '7'}),
+        FakeResponse(200, b'[]')
+    )
+
+    assert asyncio.run(_post_json(session, 'http://server', {})) == []
+    assert sleeps == [7.0]
+
+
+def test_post_json_backs_off_exponentially_and_gives_up(sleeps):
+    session = FakeSession(*(FakeResponse(503, b'unavailable') for _ in range(HTTP_MAX_ATTEMPTS)))
+
+    with pytest.raises(Exception, match='status 503'):
+        asyncio.run(_post_json(session, 'http://server', {}))
+    assert len(session.requests) == HTTP_MAX_ATTEMPTS
+    assert sleeps == [2 ** attempt for attempt in range(HTTP_MAX_ATTEMPTS - 1)]
+
+
+def test_post_json_does_not_retry_client_errors(sleeps):
+    session = FakeSession(FakeResponse(400, b'bad request'))
+
+    with pytest.raises(Exception, match='status 400: bad request'):
+        asyncio.run(_post_json(session, 'http://server', {}))
+    assert sleeps == []
+
+
+def test_post_json_compresses_large_bodies(sleeps):
+    session = FakeSession(FakeResponse(200), FakeResponse(200))
+    payload = {'source': ['Hello'] * 500}
+
+    asyncio.run(_post_json(session, 'http://server', payload, compress=True))
+    asyncio.run(_post_json(session, 'http://server', {'source': ['Hi']}, compress=True))
+
+    _, large = session.requests[0]
+    assert large['headers']['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(large['data'])) == payload
+    assert session.requests[1][1] == {'json': {'source': ['Hi']}}
+
+
+def test_pack_texts_respects_count_and_character_limits():
+    chunks = _pack_texts(['aa', 'bbb', 'c', 'dddddd', 'e'], max_texts=2, max_chars=4)
+
+    assert chunks == [['aa'], ['bbb', 'c'], ['dddddd'], ['e']]
+
+
+def test_pack_texts_of_nothing_is_empty():
+    assert _pack_texts([], max_texts=2, max_chars=4) == []
+
+
+def test_parse_pool_is_shut_down_at_exit(monkeypatch):
+    registered = []
+    monkeypatch.setattr(base.atexit, 'register', registered.append)
+    base._parse_pool.cache_clear()
+    try:
+        pool = base._parse_pool()
+        assert registered == [pool.shutdown]
+        pool.shutdown()
+    finally:
+        base._parse_pool.cache_clear()
@@ -0,0 +1,93 @@
+"""Tests for the DeepL REST client."""
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("pysubs2")
+pytest.importorskip("aiohttp")
+
+from subtitle_translator.translators import deepl_translator
+from subtitle_translator.translators.deepl_translator import DEEPL_FREE_API_URL, DeepLTranslator, _deepl_language
+
+
+def _run(translator, texts, post_json):
+    async def run():
+        with mock.patch.object(deepl_translator, '_post_json', post_json):
+            try:
+                return await translator._translate_batch(texts, 'eng_Latn', 'nld_Latn')
+            finally:
+                await translator.close()
+    return asyncio.run(run())
+
+
+def test_distinct_texts_are_sent_in_chunks_and_fanned_out(monkeypatch):
+    monkeypatch.setattr(deepl_translator, 'DEEPL_MAX_TEXTS', 2)
+    requests = []
+
+    async def post_json(session, url, payload, compress=False):
+        requests.append((url, payload))
+        return {'translations': [{'text': text.upper()} for text in payload['text']]}
+
+    translator = DeepLTranslator({'api_key': 'key:fx'})
+    result = _run(translator, ['a', 'b', 'a', 'c'], post_json)
+
+    assert result == ['A', 'B', 'A', 'C']
+    assert [payload['text'] for _, payload in requests] == [['a', 'b'], ['c']]
+    assert all(url == DEEPL_FREE_API_URL for url, _ in requests)
+    assert requests[0][1]['source_lang'] == 'EN'
+    assert requests[0][1]['target_lang'] == 'NL'
+
+
+def test_requests_in_flight_are_bounded(monkeypatch):
+    monkeypatch.setattr(deepl_translator, 'DEEPL_MAX_TEXTS', 1)
+    in_flight = 0
+    most_in_flight = 0
+
+    async def post_json(session, url, payload, compress=False):
+        nonlocal in_flight, most_in_flight
+        in_flight += 1
+        most_in_flight = max(most_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {'translations': [{'text': text} for text in payload['text']]}
+
+    translator = DeepLTranslator({'api_key': 'key', 'concurrency': 2})
+    _run(translator, [str(i) for i in range(6)], post_json)
+
+    assert most_in_flight == 2
+
+
+@pytest.mark.parametrize('nllb, deepl', [
+    ('eng_Latn', 'EN'),
+    ('nld_Latn', 'NL'),
+    ('spa_Latn', 'ES'),
+    ('jpn_Jpan', 'JA'),
+    ('por_Latn', 'PT'),
+    ('pol_Latn', 'PL'),
+    ('tur_Latn', 'TR'),
+    ('zho_Hant', 'ZH'),
+])
+def test_nllb_codes_map_to_deepl_codes(nllb, deepl):
+    assert _deepl_language(nllb) == deepl
+
+
+def test_requests_use_mapped_language_codes():
+    requests = []
+
+    async def post_json(session, url, payload, compress=False):
+        requests.append(payload)
+        return {'translations': [{'text': text} for text in payload['text']]}
+
+    translator = DeepLTranslator({'api_key': 'key'})
+
+    async def run():
+        with mock.patch.object(deepl_translator, '_post_json', post_json):
+            try:
+                return await translator._translate_batch(['Hola'], 'spa_Latn', 'pol_Latn')
+            finally:
+                await translator.close()
+    asyncio.run(run())
+
+    assert (requests[0]['source_lang'], requests[0]['target_lang']) == ('ES', 'PL')
@@ -0,0 +1,60 @@
+"""Tests for the Gemini translator."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("pysubs2")
+pytest.importorskip("aiohttp")
+pytest.importorskip("google.generativeai")
+
+from subtitle_translator.core.translator import TranslationConfig
+from subtitle_translator.translators.gemini_translator import GeminiTranslator
+
+
+def _translator(template, tone=""):
+    # Skip __init__, which configures the Gemini client
+    translator = GeminiTranslator.__new__(GeminiTranslator)
+    translator.prompt_template = template
+    translator.tone = tone
+    return translator
+
+
+def test_default_template_prompt_contains_text():
+    translator = _translator(TranslationConfig().gemini_prompt_template)
+    parts = translator._prompt_parts('eng_Latn', 'nld_Latn')
+
+    prompt = translator._text_prompt("Good morning", parts)
+
+    assert "from eng_Latn to nld_Latn" in prompt
+    assert prompt.endswith("\n\nGood morning")
+
+
+def test_text_placeholder_is_replaced():
+    translator = _translator("Translate to {LANG} ({TONE}): {TEXT}", tone="casual")
+    parts = translator._prompt_parts('eng_Latn', 'nld_Latn')
+
+    assert translator._text_prompt("Good morning", parts) == "Translate to nld_Latn (casual): Good morning"
+
+
+def test_batch_prompt_with_default_template_contains_lines():
+    translator = _translator(TranslationConfig().gemini_prompt_template)
+    parts = translator._prompt_parts('eng_Latn', 'nld_Latn')
+
+    prompt = translator._batch_prompt(["Hi", "Two\nlines"], parts)
+
+    assert prompt.endswith("[1] Hi\n[2] Two<br>lines")
+
+
+def test_translate_text_raises_when_the_request_fails():
+    translator = _translator("{TEXT}")
+    translator.api_key = "key"
+    translator.concurrency = 1
+    translator._pricing = None
+
+    async def generate(prompt, semaphore):
+        raise ConnectionError("service unavailable")
+    translator._generate = generate
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(translator.translate_text("Hi", 'eng_Latn', 'nld_Latn'))
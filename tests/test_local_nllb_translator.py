@@ -0,0 +1,28 @@
+"""Tests for the local NLLB translator."""
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("pysubs2")
+pytest.importorskip("aiohttp")
+
+from subtitle_translator.translators.local_nllb_translator import LocalNLLBTranslator
+
+
+def test_short_response_leaves_missing_lines_empty():
+    translator = LocalNLLBTranslator({'endpoint': 'http://localhost:6060', 'batch_size': 2})
+
+    async def post_json(session, url, payload, compress=False):
+        # The server drops the last text of every batch
+        return {'translation': [text.upper() for text in payload['source']][:1]}
+
+    async def run():
+        with mock.patch('subtitle_translator.translators.local_nllb_translator._post_json', post_json):
+            try:
+                return await translator._translate_batch(['a', 'b', 'c', 'a'], 'eng_Latn', 'nld_Latn')
+            finally:
+                await translator.close()
+
+    assert asyncio.run(run()) == ['A', '', 'C', 'A']
@@ -0,0 +1,105 @@
+"""Tests for BaseTranslator.translate_file."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("pysubs2")
+pytest.importorskip("aiohttp")
+
+from subtitle_translator.translators import base
+from subtitle_translator.translators.base import BaseTranslator
+from subtitle_translator.translators.local_nllb_translator import LocalNLLBTranslator
+
+SRT = "1\n00:00:01,000 --> 00:00:02,000\n{text}\n\n"
+
+
+class FakeTranslator(BaseTranslator):
+    """Translator that uppercases texts, or fails when told to."""
+
+    def __init__(self, fail=False):
+        super().__init__({'use_cache': False})
+        self.fail = fail
+        self.calls = []
+        self.release = asyncio.Event()
+
+    async def translate_text(self, text, source_language, target_language, **kwargs):
+        return (await self._translate_batch([text], source_language, target_language))[0]
+
+    async def _translate_batch(self, texts, source_language, target_language, **kwargs):
+        self.calls.append(list(texts))
+        await self.release.wait()
+        if self.fail:
+            raise ConnectionError("backend down")
+        return [text.upper() for text in texts]
+
+
+def _write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(SRT.format(text=text), encoding="utf-8")
+    return path
+
+
+def _translate_both(translator, first, second):
+    async def run():
+        tasks = [
+            asyncio.ensure_future(translator.translate_file(path, 'eng_Latn', 'nld_Latn'))
+            for path in (first, second)
+        ]
+        # Let both files register their lines before the backend answers
+        while not translator.calls:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.1)
+        translator.release.set()
+        return await asyncio.gather(*tasks)
+    return asyncio.run(run())
+
+
+def test_shared_lines_are_translated_once(tmp_path):
+    translator = FakeTranslator()
+    results = _translate_both(
+        translator, _write(tmp_path, "a.srt", "Hello there"), _write(tmp_path, "b.srt", "Hello there")
+    )
+
+    assert translator.calls == [["Hello there"]]
+    for _, translated in results:
+        assert translated[0].plaintext == "HELLO THERE"
+
+
+def test_shared_line_failure_fails_every_waiting_file(tmp_path):
+    translator = FakeTranslator(fail=True)
+    results = _translate_both(
+        translator, _write(tmp_path, "a.srt", "Hello there"), _write(tmp_path, "b.srt", "Hello there")
+    )
+
+    assert results == [None, None]
+    assert not translator._inflight
+
+
+def test_rebinding_the_endpoint_forgets_translations():
+    translator = LocalNLLBTranslator({'endpoint': 'http://a', 'use_cache': False})
+    translator._remember(('eng_Latn', 'nld_Latn', 'Hi'), 'Hoi')
+
+    assert translator.rebind({'endpoint': 'http://a', 'use_cache': False, 'batch_size': 8})
+    assert translator._tm_cache
+    assert translator.rebind({'endpoint': 'http://b', 'use_cache': False, 'batch_size': 8})
+    assert not translator._tm_cache
+
+
+def test_translation_memory_is_bounded(monkeypatch):
+    monkeypatch.setattr(base, 'TM_CACHE_SIZE', 2)
+    translator = FakeTranslator()
+    for text in ('a', 'b', 'c'):
+        translator._remember(('eng_Latn', 'nld_Latn', text), text.upper())
+
+    assert [text for _, _, text in translator._tm_cache] == ['b', 'c']
+
+
+def test_non_utf8_files_fail_instead_of_losing_characters(tmp_path):
+    path = tmp_path / "latin1.srt"
+    path.write_bytes(SRT.format(text="Café").encode("latin-1"))
+    translator = FakeTranslator()
+    translator.release.set()
+
+    assert asyncio.run(translator.translate_file(path, 'eng_Latn', 'nld_Latn')) is None
+    assert translator.calls == []
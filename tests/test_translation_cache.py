@@ -0,0 +1,56 @@
+"""Tests for the persistent line cache."""
+
+import time
+
+from subtitle_translator.utils.translation_cache import TranslationCache
+
+
+def test_stored_translations_are_found_again(tmp_path):
+    path = tmp_path / "lines.sqlite3"
+    cache = TranslationCache(path)
+    hello = cache.key("Backend|{}", "eng_Latn", "nld_Latn", "Hello")
+    bye = cache.key("Backend|{}", "eng_Latn", "nld_Latn", "Bye")
+    cache.put_many({hello: "Hallo", bye: "Doei"})
+    cache.close()
+
+    reopened = TranslationCache(path)
+    try:
+        assert reopened.get_many([hello, bye]) == {hello: "Hallo", bye: "Doei"}
+    finally:
+        reopened.close()
+
+
+def test_keys_depend_on_every_part():
+    key = TranslationCache.key("Backend|{}", "eng_Latn", "nld_Latn", "Hello")
+
+    assert key == TranslationCache.key("Backend|{}", "eng_Latn", "nld_Latn", "Hello")
+    assert key != TranslationCache.key("Other|{}", "eng_Latn", "nld_Latn", "Hello")
+    assert key != TranslationCache.key("Backend|{}", "eng_Latn", "deu_Latn", "Hello")
+    assert key != TranslationCache.key("Backend|{}", "eng_Latn", "nld_Latn", "Hello!")
+
+
+def test_lookups_larger_than_one_query(tmp_path):
+    cache = TranslationCache(tmp_path / "lines.sqlite3")
+    try:
+        items = {cache.key("B", "en", "nl", str(i)): str(i) for i in range(1200)}
+        cache.put_many(items)
+        missing = cache.key("B", "en", "nl", "missing")
+
+        assert cache.get_many(list(items) + [missing]) == items
+    finally:
+        cache.close()
+
+
+def test_expired_entries_are_misses(tmp_path, monkeypatch):
+    cache = TranslationCache(tmp_path / "lines.sqlite3", ttl=60)
+    try:
+        key = cache.key("B", "en", "nl", "Hello")
+        monkeypatch.setattr(time, "time", lambda: 1000.0)
+        cache.put_many({key: "Hallo"})
+
+        monkeypatch.setattr(time, "time", lambda: 1030.0)
+        assert cache.get_many([key]) == {key: "Hallo"}
+        monkeypatch.setattr(time, "time", lambda: 1100.0)
+        assert cache.get_many([key]) == {}
+    finally:
+        cache.close()
@@ -0,0 +1,110 @@
+"""Tests for core.Translator."""
+
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("pysubs2")
+pytest.importorskip("aiohttp")
+
+from subtitle_translator.core import translator as core
+from subtitle_translator.core.translator import TranslationConfig, Translator
+from subtitle_translator.translators.base import BaseTranslator
+
+SRT = (
+    "1\n00:00:01,000 --> 00:00:02,000\nHello there\n\n"
+    "2\n00:00:03,000 --> 00:00:04,000\nGood bye\n\n"
+)
+
+
+class FlakyTranslator(BaseTranslator):
+    """Uppercases texts, except those listed in ``failing``."""
+
+    def __init__(self):
+        super().__init__({'use_cache': False})
+        self.failing = set()
+        self.calls = 0
+
+    async def translate_text(self, text, source_language, target_language, **kwargs):
+        return (await self._translate_batch([text], source_language, target_language))[0]
+
+    async def _translate_batch(self, texts, source_language, target_language, **kwargs):
+        self.calls += 1
+        return ['' if text in self.failing else text.upper() for text in texts]
+
+
+@pytest.fixture
+def translator(tmp_path, monkeypatch):
+    monkeypatch.setattr(core, 'TRANSLATION_CACHE_DIR', tmp_path / 'cache')
+    translator = Translator(TranslationConfig(source_language='eng_Latn', target_language='nld_Latn'))
+    translator.translator = FlakyTranslator()
+    return translator
+
+
+def _translate(translator, path):
+    result = asyncio.run(translator.translate_file(path))
+    return [event.plaintext for event in result[1]]
+
+
+def test_partially_translated_files_are_not_cached(translator, tmp_path):
+    path = tmp_path / 'a.srt'
+    path.write_text(SRT, encoding='utf-8')
+    translator.translator.failing = {'Good bye'}
+
+    assert _translate(translator, path) == ['HELLO THERE', 'Good bye']
+
+    # The backend recovers: the failed line is translated instead of served from the cache
+    translator.translator.failing = set()
+    assert _translate(translator, path) == ['HELLO THERE', 'GOOD BYE']
+    assert translator.translator.calls == 2
+
+    # Complete translations are cached
+    assert _translate(translator, path) == ['HELLO THERE', 'GOOD BYE']
+    assert translator.translator.calls == 2
+
+
+def test_expired_files_are_translated_again(translator, tmp_path):
+    path = tmp_path / 'a.srt'
+    path.write_text(SRT, encoding='utf-8')
+    translator.config.cache_ttl = 60
+    _translate(translator, path)
+    for cached in (tmp_path / 'cache').iterdir():
+        os.utime(cached, (0, 0))
+    translator.translator._tm_cache.clear()
+
+    _translate(translator, path)
+
+    assert translator.translator.calls == 2
+
+
+def test_cache_directory_is_capped(tmp_path):
+    for i in range(5):
+        cached = tmp_path / f'{i}.srt'
+        cached.write_text('')
+        os.utime(cached, (i, i))
+
+    core._prune_cache_dir(tmp_path, 3)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['2.srt', '3.srt', '4.srt']
+
+
+def test_replaced_backends_are_closed_before_close_returns(translator):
+    closed = []
+
+    async def run():
+        old_backend = translator.translator
+
+        async def close_old():
+            await asyncio.sleep(0.01)
+            closed.append(old_backend)
+        translator._close = close_old
+        translator.update_config(translator_type='huggingface')
+        assert translator._close_tasks
+        await translator.close()
+        return old_backend
+
+    old_backend = asyncio.run(run())
+
+    assert closed == [old_backend]
+    assert not translator._close_tasks